@@ -23,6 +23,41 @@ import pickle
 logger = logging.getLogger(__name__)
 
 
+def _serialize_agent_state(agent: Any) -> Dict:
+    """
+    Collect the public, picklable attributes of an agent instance.
+
+    Supports both regular (__dict__-based) agents and agents that declare
+    __slots__ for a smaller memory footprint.
+
+    Args:
+        agent: Agent instance to serialize
+
+    Returns:
+        Dict of attribute name -> value, safe to pickle across processes
+    """
+    if hasattr(agent, '__dict__'):
+        items = list(agent.__dict__.items())
+    else:
+        # Slotted class: walk the MRO to gather all declared slots
+        names = []
+        for klass in type(agent).__mro__:
+            names.extend(getattr(klass, '__slots__', ()))
+        items = [(name, getattr(agent, name)) for name in names
+                 if hasattr(agent, name)]
+
+    state = {}
+    for key, value in items:
+        if not key.startswith('_') and not callable(value):
+            try:
+                # Test if picklable
+                pickle.dumps(value)
+                state[key] = value
+            except:
+                pass  # Skip non-picklable attributes
+    return state
+
+
 def _worker_execute_bid(file_path: str, team_id: str, valuation_vector: Dict[str, float],
                         budget: float, opponent_teams: list, item_id: str,
                         agent_state: Optional[Dict], result_queue: mp.Queue):
@@ -76,16 +111,8 @@ def _worker_execute_bid(file_path: str, team_id: str, valuation_vector: Dict[str
         
         # Serialize agent state for next round
         # Only serialize safe attributes (not methods or private internals)
-        new_state = {}
-        for key, value in agent.__dict__.items():
-            if not key.startswith('_') and not callable(value):
-                try:
-                    # Test if picklable
-                    pickle.dumps(value)
-                    new_state[key] = value
-                except:
-                    pass  # Skip non-picklable attributes
-        
+        new_state = _serialize_agent_state(agent)
+
         result_queue.put(('success', float(bid), execution_time, new_state, None))
         
     except Exception as e:
@@ -136,15 +163,8 @@ def _worker_update_agent(file_path: str, team_id: str, valuation_vector: Dict[st
         agent.update_after_each_round(item_id, winning_team, price_paid)
         
         # Serialize new state
-        new_state = {}
-        for key, value in agent.__dict__.items():
-            if not key.startswith('_') and not callable(value):
-                try:
-                    pickle.dumps(value)
-                    new_state[key] = value
-                except:
-                    pass
-        
+        new_state = _serialize_agent_state(agent)
+
         result_queue.put(('success', new_state, None))
         
     except Exception as e:
@@ -370,7 +390,115 @@ class AgentManager:
             except:
                 pass
     
-    def update_agent_after_round(self, agent: Any, item_id: str, 
+    def execute_bids_batch(self, agents: list, item_id: str) -> Dict[str, Tuple[float, float, Optional[str]]]:
+        """
+        Collect one round's bids from every agent with overlapped execution.
+
+        SECURITY: Isolation is unchanged — each agent still bids in its own
+        process. The processes are simply started together and joined
+        afterwards, so the round's wall time is the slowest agent rather
+        than the sum of all agents. Bids within a round are independent
+        (agents only observe results via update_after_each_round), so the
+        results are identical to the serial path.
+
+        Args:
+            agents: List of agent proxy objects (each contains team_id)
+            item_id: ID of item being auctioned
+
+        Returns:
+            Dict mapping team_id to (bid_amount, execution_time, error_msg),
+            with the same per-team semantics as execute_bid_with_timeout.
+        """
+        results = {}
+        pending = []
+
+        for agent in agents:
+            team_id = agent.team_id
+
+            if team_id not in self.agent_metadata:
+                logger.error(f"Team {team_id} not registered")
+                results[team_id] = (0.0, 0.0, "Agent not registered")
+                continue
+
+            metadata = self.agent_metadata[team_id]
+            agent_state = self.agent_states[team_id]
+
+            try:
+                result_queue = mp.Queue()
+
+                process = mp.Process(
+                    target=_worker_execute_bid,
+                    args=(
+                        metadata['file_path'],
+                        metadata['team_id'],
+                        metadata['valuation_vector'],
+                        metadata['budget'],
+                        metadata['opponent_teams'],
+                        item_id,
+                        agent_state,
+                        result_queue
+                    )
+                )
+
+                start_time = time.time()
+                process.start()
+                pending.append((team_id, process, result_queue, start_time))
+
+            except Exception as e:
+                logger.error(f"Team {team_id}: Unexpected error starting bid process: {e}", exc_info=True)
+                results[team_id] = (0.0, 0.0, f"Exception: {str(e)}")
+
+        for team_id, process, result_queue, start_time in pending:
+            try:
+                # Each agent keeps its full window, measured from its own
+                # process start; the waits overlap because every process
+                # is already running
+                remaining = self.timeout_seconds - (time.time() - start_time)
+                process.join(timeout=max(0.0, remaining))
+
+                execution_time = time.time() - start_time
+
+                if process.is_alive():
+                    process.terminate()
+                    process.join(timeout=1.0)
+                    if process.is_alive():
+                        process.kill()  # Force kill if terminate didn't work
+                    logger.warning(f"Team {team_id}: Bid execution timeout ({self.timeout_seconds}s)")
+                    results[team_id] = (0.0, self.timeout_seconds, "Timeout")
+                    continue
+
+                try:
+                    status, bid, exec_time, new_state, error = result_queue.get(timeout=0.5)
+
+                    if status == 'success':
+                        # Update agent state for next round
+                        self.agent_states[team_id] = new_state
+                        # Round bid to 2 decimal places
+                        rounded_bid = round(float(bid), 2)
+                        logger.debug(f"Team {team_id}: Bid {rounded_bid:.2f} in {exec_time:.3f}s")
+                        results[team_id] = (rounded_bid, exec_time, None)
+                    else:
+                        logger.error(f"Team {team_id}: Bid execution error: {error}")
+                        results[team_id] = (0.0, execution_time, f"Error: {error}")
+
+                except Exception as e:
+                    logger.error(f"Team {team_id}: Failed to get result from queue: {e}")
+                    results[team_id] = (0.0, execution_time, "No result returned")
+
+            except Exception as e:
+                execution_time = time.time() - start_time
+                logger.error(f"Team {team_id}: Unexpected error in bid execution: {e}", exc_info=True)
+                results[team_id] = (0.0, execution_time, f"Exception: {str(e)}")
+            finally:
+                # Clean up
+                try:
+                    result_queue.close()
+                except:
+                    pass
+
+        return results
+
+    def update_agent_after_round(self, agent: Any, item_id: str,
                                 winning_team: str, price_paid: float) -> bool:
         """
         Update agent with round results in isolated process.
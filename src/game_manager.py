@@ -137,18 +137,21 @@ class GameManager:
         """
         logger.info(f"=== Round {round_number}/{T_AUCTION_ROUNDS}: Item {item_id} ===")
         
-        # Collect bids from all agents
+        # Collect bids from all agents in one batch; the agents' isolated
+        # bid processes run concurrently instead of one after another
         bids = {}
         execution_times = {}
-        
-        for team_id, agent in self.agents.items():
-            bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, item_id)
+
+        batch_results = self.agent_manager.execute_bids_batch(
+            list(self.agents.values()), item_id)
+
+        for team_id, (bid, exec_time, error) in batch_results.items():
             bids[team_id] = bid
             execution_times[team_id] = exec_time
-            
+
             if error:
                 logger.warning(f"Team {team_id} bid error: {error}")
-            
+
             logger.debug(f"Team {team_id}: Bid={bid:.2f}, Budget={self.budgets[team_id]:.2f}, Time={exec_time:.3f}s")
         
         # Execute auction
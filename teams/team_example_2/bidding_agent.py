@@ -3,24 +3,48 @@ Example Agent 4: Random Bidder (Baseline)
 Bids random amounts - useful for testing and as a baseline
 """
 
+import sys
+import zlib
 from typing import Dict, List
-import random
+
+import numpy as np
 
 
 class BiddingAgent:
     """Random bidding strategy - for testing purposes"""
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won', 'rand_buf',
+                 'round_idx', '_rng', '_ids', '_item_index', '_values_np')
     
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
         self.items_won = []
-        
-        random.seed()
+
+        # Pre-sample one random fraction per round instead of calling the
+        # RNG on every bid; public so the buffer and cursor survive the
+        # sandbox round-trip between rounds. Seeded from the team id
+        # (crc32, not hash(), which is salted per process) so tournament
+        # runs replay deterministically.
+        self._rng = np.random.default_rng(zlib.crc32(team_id.encode()))
+        self.rand_buf = self._rng.random(15)
+        self.round_idx = 0
+
+        # Constant per game; rebuilt in __init__, used by the batch path
+        self._ids = list(self.valuation_vector)
+        self._item_index = {k: i for i, k in enumerate(self._ids)}
+        self._values_np = np.fromiter((self.valuation_vector[k]
+                                       for k in self._ids),
+                                      dtype=np.float64)
     
     def _update_available_budget(self, item_id: str, winning_team: str, price_paid: float):
         if winning_team == self.team_id:
@@ -28,9 +52,11 @@ class BiddingAgent:
             self.items_won.append(item_id)
     
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
         self._update_available_budget(item_id, winning_team, price_paid)
         if winning_team == self.team_id:
             self.utility += (self.valuation_vector[item_id] - price_paid)
+        self.round_idx = min(self.round_idx + 1, len(self.rand_buf) - 1)
         return True
     
     def bidding_function(self, item_id: str) -> float:
@@ -38,13 +64,20 @@ class BiddingAgent:
         Random bidding: bid a random fraction of valuation.
         Still respects budget constraints.
         """
+        item_id = sys.intern(item_id)
         valuation = self.valuation_vector.get(item_id, 0)
-        
-        # Bid between 0% and 100% of valuation randomly
-        fraction = random.uniform(0, 1)
+
+        # Bid between 0% and 100% of valuation randomly (pre-sampled)
+        fraction = self.rand_buf[self.round_idx]
         bid = valuation * fraction
         
         # Don't exceed budget
         bid = min(bid, self.budget)
-        
+
         return bid
+
+    def bidding_function_batch(self, item_ids: List[str]) -> np.ndarray:
+        """Vectorized what-if: random-fraction bids, one RNG call for all."""
+        values = self._values_np[[self._item_index[i] for i in item_ids]]
+        fractions = self._rng.uniform(0, 1, size=len(item_ids))
+        return np.minimum(values * fractions, self.budget)
@@ -3,30 +3,50 @@ Example Agent 2: Budget-Aware Bidder
 Considers remaining budget and future rounds when bidding
 """
 
+import sys
 from typing import Dict, List
 
+import numpy as np
+
 
 class BiddingAgent:
     """Budget-aware strategy - scales bids based on remaining budget"""
+
+    # Always 15 rounds per game; class-level constant rather than state
+    TOTAL_ROUNDS = 15
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won', 'rounds_completed',
+                 '_ids', '_item_index', '_values_np')
     
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
         self.items_won = []
         self.rounds_completed = 0
-        self.total_rounds = 15  # Always 15 rounds per game
-    
+
+        # Constant per game; rebuilt in __init__, used by the batch path
+        self._ids = list(self.valuation_vector)
+        self._item_index = {k: i for i, k in enumerate(self._ids)}
+        self._values_np = np.fromiter((self.valuation_vector[k]
+                                       for k in self._ids),
+                                      dtype=np.float64)
+
     def _update_available_budget(self, item_id: str, winning_team: str, price_paid: float):
         if winning_team == self.team_id:
             self.budget -= price_paid
             self.items_won.append(item_id)
     
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
         self._update_available_budget(item_id, winning_team, price_paid)
         if winning_team == self.team_id:
             self.utility += (self.valuation_vector[item_id] - price_paid)
@@ -40,10 +60,11 @@ class BiddingAgent:
         - Be more conservative if many rounds left
         - Be more aggressive near the end
         """
+        item_id = sys.intern(item_id)
         valuation = self.valuation_vector.get(item_id, 0)
         
         # Calculate rounds remaining
-        rounds_remaining = self.total_rounds - self.rounds_completed
+        rounds_remaining = self.TOTAL_ROUNDS - self.rounds_completed
         
         if rounds_remaining == 0:
             return 0
@@ -53,9 +74,23 @@ class BiddingAgent:
         
         # Bid strategy: bid up to valuation, but be mindful of budget
         # Allow higher bids near the end of the game
-        progress = self.rounds_completed / self.total_rounds
+        progress = self.rounds_completed / self.TOTAL_ROUNDS
         aggressiveness = 0.7 + (0.3 * progress)  # 70% to 100% as game progresses
         
         bid = min(valuation * aggressiveness, self.budget, valuation)
-        
+
         return max(0, bid)
+
+    def bidding_function_batch(self, item_ids: List[str]) -> np.ndarray:
+        """Vectorized what-if: budget-aware bids for many items at once."""
+        rounds_remaining = self.TOTAL_ROUNDS - self.rounds_completed
+        if rounds_remaining == 0:
+            return np.zeros(len(item_ids))
+
+        progress = self.rounds_completed / self.TOTAL_ROUNDS
+        aggressiveness = 0.7 + (0.3 * progress)
+
+        values = self._values_np[[self._item_index[i] for i in item_ids]]
+        bids = np.minimum(np.minimum(values * aggressiveness, self.budget),
+                          values)
+        return np.maximum(0, bids)
@@ -3,17 +3,25 @@ Example Agent 3: Strategic Bidder with Opponent Modeling
 Attempts to learn opponent behavior and adjust strategy
 """
 
+import sys
 from typing import Dict, List
-import numpy as np
 
 
 class BiddingAgent:
     """Strategic bidding with simple opponent modeling"""
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won', 'rounds_completed',
+                 'observed_prices', 'opponent_wins', 'price_sum',
+                 'price_count', 'price_max')
     
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
@@ -24,6 +32,12 @@ class BiddingAgent:
         # Opponent modeling
         self.observed_prices = []
         self.opponent_wins = {}
+
+        # Running price stats (mean/max in O(1) instead of rescanning
+        # the history on every bid)
+        self.price_sum = 0.0
+        self.price_count = 0
+        self.price_max = 0.0
     
     def _update_available_budget(self, item_id: str, winning_team: str, price_paid: float):
         if winning_team == self.team_id:
@@ -31,6 +45,12 @@ class BiddingAgent:
             self.items_won.append(item_id)
     
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
+        # Broke agents bid 0, so price tracking cannot affect future bids
+        if self.budget <= 0 and winning_team != self.team_id:
+            self.rounds_completed += 1
+            return True
+
         self._update_available_budget(item_id, winning_team, price_paid)
         
         if winning_team == self.team_id:
@@ -39,6 +59,10 @@ class BiddingAgent:
         # Track opponent behavior
         if winning_team and price_paid > 0:
             self.observed_prices.append(price_paid)
+            self.price_sum += price_paid
+            self.price_count += 1
+            if price_paid > self.price_max:
+                self.price_max = price_paid
             self.opponent_wins[winning_team] = self.opponent_wins.get(winning_team, 0) + 1
         
         self.rounds_completed += 1
@@ -51,15 +75,16 @@ class BiddingAgent:
         - Adjust bids based on item value relative to observed prices
         - Consider budget constraints
         """
+        item_id = sys.intern(item_id)
         valuation = self.valuation_vector.get(item_id, 0)
         
         if self.budget <= 0:
             return 0
         
         # Calculate average price so far (market estimate)
-        if self.observed_prices:
-            avg_price = np.mean(self.observed_prices)
-            max_price = np.max(self.observed_prices)
+        if self.price_count:
+            avg_price = self.price_sum / self.price_count
+            max_price = self.price_max
         else:
             # No data yet, be conservative
             avg_price = 5.0
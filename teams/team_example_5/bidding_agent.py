@@ -3,28 +3,46 @@ Example Agent 1: Truthful Bidder
 Bids exactly the valuation (optimal in standard Vickrey auctions without budget constraints)
 """
 
+import sys
 from typing import Dict, List
 
+import numpy as np
+
 
 class BiddingAgent:
     """Truthful bidding strategy - always bid your true valuation"""
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won', '_ids',
+                 '_item_index', '_values_np')
     
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
         self.items_won = []
-    
+
+        # Constant per game; rebuilt in __init__, used by the batch path
+        self._ids = list(self.valuation_vector)
+        self._item_index = {k: i for i, k in enumerate(self._ids)}
+        self._values_np = np.fromiter((self.valuation_vector[k]
+                                       for k in self._ids),
+                                      dtype=np.float64)
+
     def _update_available_budget(self, item_id: str, winning_team: str, price_paid: float):
         if winning_team == self.team_id:
             self.budget -= price_paid
             self.items_won.append(item_id)
     
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
         self._update_available_budget(item_id, winning_team, price_paid)
         if winning_team == self.team_id:
             self.utility += (self.valuation_vector[item_id] - price_paid)
@@ -35,6 +53,12 @@ class BiddingAgent:
         Truthful bidding: bid exactly your valuation.
         Cap at budget to ensure feasibility.
         """
+        item_id = sys.intern(item_id)
         valuation = self.valuation_vector.get(item_id, 0)
         bid = min(valuation, self.budget)
         return bid
+
+    def bidding_function_batch(self, item_ids: List[str]) -> np.ndarray:
+        """Vectorized what-if: truthful bids for many items in one pass."""
+        idx = [self._item_index[i] for i in item_ids]
+        return np.minimum(self._values_np[idx], self.budget)
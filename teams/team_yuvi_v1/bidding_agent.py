@@ -20,10 +20,106 @@ KEY INSIGHT: In multi-player sequential Vickrey:
 
 from typing import Dict, List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _bid_kernel(my_valuation, rounds_left, budget, shade,
+                high_competition_count, low_competition_count,
+                avg_aggression, active_opps,
+                max_opp_budget, target_spend, rem_count, rem_avg):
+    """Scalar core of _calculate_bid, compiled when numba is available."""
+    min_spend_rate = budget / rounds_left
+
+    # ===== PHASE 1: BASE SHADE =====
+    # The tier shade is precomputed per item at construction time
+    bid = my_valuation * shade
+
+    # ===== PHASE 2: COMPETITION ADJUSTMENT =====
+    # "High-value-for-all" estimate: very high valuations usually are;
+    # mid-high ones only once the market has run hot (branchless or of
+    # two comparison results under LLVM)
+    is_competitive = my_valuation > 14 or (
+        high_competition_count - low_competition_count > 2
+        and my_valuation > 10)
+    if is_competitive:
+        # Likely "high-value-for-all" - everyone wants it
+        bid = min(my_valuation * 0.95, bid * 1.1)
+
+    if avg_aggression > 0.5:
+        bid *= 1.05    # Aggressive field - need to bid higher
+    elif avg_aggression < 0.25:
+        bid *= 0.95    # Passive field - can shade more
+
+    # ===== PHASE 3: OPPONENT BUDGET AWARENESS =====
+    if active_opps <= 1:
+        bid *= 0.92    # Few threats - we can relax a bit
+
+    if max_opp_budget < 20:
+        bid = min(bid, max_opp_budget + 5)
+    if max_opp_budget < 10:
+        # Opponents nearly broke - bid just enough to win
+        bid = min(bid, max_opp_budget + 2)
+
+    # ===== PHASE 4: BUDGET UTILIZATION (CRITICAL!) =====
+    if bid < target_spend and my_valuation > target_spend * 0.8:
+        bid = max(bid, target_spend)
+
+    # ===== PHASE 5: LATE GAME RULES (NEVER LEAVE BUDGET!) =====
+    if rounds_left <= 6:
+        min_bid = min_spend_rate * 0.7
+        if my_valuation > min_bid:
+            bid = max(bid, min_bid)
+
+    if rounds_left <= 4 and my_valuation > 0:
+        # Must spend at least 1/rounds_left of budget (= min_spend_rate)
+        bid = max(bid, min(min_spend_rate, my_valuation))
+
+    if rounds_left <= 2 and my_valuation > 0:
+        # Spend at least 40% of remaining budget
+        bid = max(bid, min(budget * 0.4, my_valuation))
+
+    if rounds_left == 1:
+        # LAST ROUND - spend everything (up to valuation)
+        bid = min(my_valuation, budget)
+
+    # ===== PHASE 6: PRIORITY BOOST =====
+    # Is this item better than what we expect to see?
+    if rem_count > 0 and my_valuation > rem_avg * 1.3:
+        # This is a great opportunity - boost bid
+        bid = min(bid * 1.1, my_valuation * 0.98)
+
+    # ===== FINAL CONSTRAINTS =====
+    # Never bid more than valuation (guarantees non-negative utility if
+    # we win) and never bid more than budget
+    return max(0.0, min(bid, budget, my_valuation))
+
 
 class BiddingAgent:
     """Advanced adaptive agent - v2 with guaranteed budget spend."""
-    
+
+    # Fixed attribute layout: smaller instances and faster attribute
+    # access than a per-instance __dict__
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won',
+                 'rounds_completed', 'total_rounds', 'rounds_left',
+                 'opp_index', 'opp_budget', 'opp_items_won', 'opp_spent',
+                 'opp_beliefs', 'price_sum', 'price_count',
+                 'last_bid_item', 'last_bid', 'seen_mask', '_item_index',
+                 'high_competition_count', 'low_competition_count',
+                 'avg_value', 'median_value', 'total_value',
+                 'top_tier_threshold', 'remaining_sum', 'remaining_count',
+                 '_item_info', '_urgency_table')
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
@@ -36,41 +132,94 @@ class BiddingAgent:
         
         self.rounds_completed = 0
         self.total_rounds = 15
-        
+        self.rounds_left = 15  # countdown mirror of rounds_completed
+
         # ===== OPPONENT TRACKING =====
-        self.opponent_data = {
-            opp: {
-                'estimated_budget': 60.0,
-                'items_won': 0,
-                'total_spent': 0.0,
-                'win_prices': [],
-                # Bayesian: aggressive/truthful/passive
-                'p_aggressive': 0.33,
-                'p_truthful': 0.34,
-                'p_passive': 0.33,
-            }
-            for opp in opponent_teams
-        }
+        # Structure-of-arrays: parallel NumPy arrays indexed by opponent
+        # position, so the per-bid aggregates (max budget, active count,
+        # mean aggression) and the Bayesian belief updates are vectorized
+        # reductions instead of Python loops over per-opponent dicts
+        n_opp = len(opponent_teams)
+        self.opp_index = {opp: i for i, opp in enumerate(opponent_teams)}
+        # float32 throughout: budgets/prices span 0-60 with 2-decimal
+        # granularity, so single precision is plenty and the reductions
+        # process twice the lanes per SIMD instruction
+        self.opp_budget = np.full(n_opp, 60.0, dtype=np.float32)  # estimated
+        self.opp_items_won = np.zeros(n_opp, dtype=np.int64)
+        self.opp_spent = np.zeros(n_opp, dtype=np.float32)
+        # Bayesian beliefs as one (n_opp, 3) matrix with columns
+        # [aggressive, truthful, passive], so renormalization is a
+        # single vectorized divide over all opponents
+        self.opp_beliefs = np.tile(np.array([0.33, 0.34, 0.33],
+                                            dtype=np.float32),
+                                   (n_opp, 1))
         
         # ===== MARKET TRACKING =====
-        self.price_history = []
-        self.my_bids = {}
-        self.auction_results = []  # (item_id, winner, price, my_bid, my_val, did_we_win)
-        self.items_seen = set()
+        # Running sum/count instead of a price list, so the average is
+        # an O(1) division rather than an O(rounds) sum every round
+        self.price_sum = 0.0
+        self.price_count = 0
+        # Only the current round's bid is ever read back (by the
+        # Bayesian update), so a scalar pair replaces the per-item dict
+        self.last_bid_item = None
+        self.last_bid = 0.0
+        # Seen-items bitset: each item gets a fixed index at init, so
+        # the first-sight check is an array load instead of hashing the
+        # id into a set (the index map is constant, rebuilt in __init__)
+        self._item_index = {k: i for i, k in enumerate(valuation_vector)}
+        self.seen_mask = np.zeros(len(valuation_vector), dtype=bool)
         
         # Track competitive vs non-competitive items
         self.high_competition_count = 0  # Items where price > 12
         self.low_competition_count = 0   # Items where price < 6
         
         # ===== VALUE ANALYSIS =====
-        values = sorted(valuation_vector.values(), reverse=True)
-        self.sorted_values = values
-        self.avg_value = sum(values) / len(values)
-        self.median_value = values[len(values) // 2]
-        self.total_value = sum(values)
-        
-        # Top 30% threshold (items we REALLY want)
-        self.top_tier_threshold = values[int(len(values) * 0.3)] if len(values) > 3 else values[0]
+        # Only two order statistics are needed, so an O(N) np.partition
+        # replaces the full sort, and the mean/total come from the same
+        # buffer in single C passes
+        arr = np.fromiter(valuation_vector.values(), dtype=np.float64,
+                          count=len(valuation_vector))
+        n_items = arr.size
+        self.avg_value = float(arr.mean())
+        self.total_value = float(arr.sum())
+
+        # Indices below are positions in descending order, mapped to
+        # their ascending np.partition positions
+        k_median = n_items - 1 - n_items // 2
+        if n_items > 3:
+            k_top = n_items - 1 - int(n_items * 0.3)
+            part = np.partition(arr, (min(k_median, k_top),
+                                      max(k_median, k_top)))
+            self.median_value = float(part[k_median])
+            # Top 30% threshold (items we REALLY want)
+            self.top_tier_threshold = float(part[k_top])
+        else:
+            self.median_value = float(np.partition(arr, k_median)[k_median])
+            self.top_tier_threshold = float(arr.max())
+
+        # Running aggregates over the not-yet-auctioned valuations,
+        # updated in O(1) per round instead of rebuilding a list per bid
+        self.remaining_sum = self.total_value
+        self.remaining_count = len(valuation_vector)
+        
+        # Urgency multiplier per rounds_left value, so _get_target_spend
+        # reads a table entry instead of branching (index 0 is unused;
+        # callers bail out before rounds_left reaches it)
+        self._urgency_table = [1.3 if r <= 3 else 1.15 if r <= 5 else 1.0
+                               for r in range(16)]
+
+        # Per-item (valuation, base shade) pairs, resolved once up
+        # front: the tier thresholds never change, so the bid path does
+        # a single dict lookup for both instead of two lookups plus
+        # three comparisons. Much less shading than before!
+        # Near-truthful is better in Vickrey: 0.92 top tier, 0.88 above
+        # average, 0.82 below average but not trash, 0.75 low value
+        self._item_info = {
+            iid: (v, (0.92 if v >= self.top_tier_threshold else
+                      0.88 if v >= self.avg_value else
+                      0.82 if v >= self.avg_value * 0.5 else 0.75))
+            for iid, v in valuation_vector.items()
+        }
         
     def _update_available_budget(self, item_id: str, winning_team: str, 
                                  price_paid: float):
@@ -80,249 +229,235 @@ class BiddingAgent:
     
     def _bayesian_update(self, winning_team: str, price_paid: float, my_bid: float):
         """Update beliefs about opponent types."""
-        avg_price = sum(self.price_history) / len(self.price_history) if self.price_history else 10
+        avg_price = self.price_sum / self.price_count if self.price_count else 10
         
         if not winning_team or winning_team == self.team_id:
-            # We won or no winner - opponents are weaker than expected
-            for opp_id, data in self.opponent_data.items():
-                shift = 0.02
-                data['p_passive'] = min(0.7, data['p_passive'] + shift)
-                self._normalize_beliefs(data)
+            # We won or no winner - opponents are weaker than expected;
+            # shift every opponent towards passive in one array pass
+            np.minimum(self.opp_beliefs[:, 2] + 0.02, 0.7,
+                       out=self.opp_beliefs[:, 2])
+            self._normalize_beliefs()
             return
-        
-        if winning_team not in self.opponent_data:
+
+        idx = self.opp_index.get(winning_team)
+        if idx is None:
             return
-            
-        opp = self.opponent_data[winning_team]
-        
+
+        row = self.opp_beliefs[idx]
+
         # Update based on price level
         if price_paid > avg_price * 1.2:
-            opp['p_aggressive'] = min(0.85, opp['p_aggressive'] * 1.3)
-            opp['p_passive'] *= 0.8
+            row[0] = min(0.85, row[0] * 1.3)
+            row[2] *= 0.8
         elif price_paid < avg_price * 0.7:
-            opp['p_passive'] = min(0.7, opp['p_passive'] * 1.2)
+            row[2] = min(0.7, row[2] * 1.2)
         else:
-            opp['p_truthful'] = min(0.7, opp['p_truthful'] * 1.15)
-        
+            row[1] = min(0.7, row[1] * 1.15)
+
         # Strong signal: they outbid us significantly
         if my_bid > 0 and price_paid > my_bid:
-            opp['p_aggressive'] = min(0.85, opp['p_aggressive'] * 1.2)
-        
-        self._normalize_beliefs(opp)
-    
-    def _normalize_beliefs(self, opp_data: dict):
-        total = opp_data['p_aggressive'] + opp_data['p_truthful'] + opp_data['p_passive']
+            row[0] = min(0.85, row[0] * 1.2)
+
+        self._normalize_beliefs(idx)
+
+    def _normalize_beliefs(self, idx: int = None):
+        """Renormalize one opponent's beliefs, or all of them if idx is None."""
+        if idx is None:
+            totals = self.opp_beliefs.sum(axis=1, keepdims=True)
+            np.divide(self.opp_beliefs, totals, out=self.opp_beliefs,
+                      where=totals > 0)
+            return
+        row = self.opp_beliefs[idx]
+        total = row.sum()
         if total > 0:
-            opp_data['p_aggressive'] /= total
-            opp_data['p_truthful'] /= total
-            opp_data['p_passive'] /= total
+            row /= total
     
     def update_after_each_round(self, item_id: str, winning_team: str, 
                                 price_paid: float):
         self._update_available_budget(item_id, winning_team, price_paid)
         self.rounds_completed += 1
+        self.rounds_left -= 1
         
         my_val = self.valuation_vector.get(item_id, 0)
-        my_bid = self.my_bids.get(item_id, 0)
-        did_win = (winning_team == self.team_id)
-        
+        my_bid = self.last_bid if self.last_bid_item == item_id else 0
+
         # Record history
-        self.price_history.append(price_paid)
-        self.auction_results.append((item_id, winning_team, price_paid, my_bid, my_val, did_win))
-        self.items_seen.add(item_id)
-        
-        # Track market competitiveness
-        if price_paid > 12:
-            self.high_competition_count += 1
-        elif price_paid < 6:
-            self.low_competition_count += 1
+        self.price_sum += price_paid
+        self.price_count += 1
+        i = self._item_index.get(item_id)
+        if i is not None and not self.seen_mask[i]:
+            self.seen_mask[i] = True
+            # Retire the item from the running remaining-value aggregates
+            self.remaining_sum -= my_val
+            self.remaining_count -= 1
+        
+        # Track market competitiveness; bools add as ints, and the two
+        # bands are mutually exclusive so the old elif is preserved
+        self.high_competition_count += price_paid > 12
+        self.low_competition_count += price_paid < 6
         
         # Update opponent data
         if winning_team and winning_team != self.team_id:
-            if winning_team in self.opponent_data:
-                opp = self.opponent_data[winning_team]
-                opp['estimated_budget'] -= price_paid
-                opp['items_won'] += 1
-                opp['total_spent'] += price_paid
-                opp['win_prices'].append(price_paid)
+            idx = self.opp_index.get(winning_team)
+            if idx is not None:
+                self.opp_budget[idx] -= price_paid
+                self.opp_items_won[idx] += 1
+                self.opp_spent[idx] += price_paid
         
         self._bayesian_update(winning_team, price_paid, my_bid)
         return True
     
     # ========== HELPER METHODS ==========
     
-    def _get_active_opponents(self) -> int:
-        """Count opponents with budget > 5."""
-        return sum(1 for d in self.opponent_data.values() if d['estimated_budget'] > 5)
-    
-    def _get_max_opponent_budget(self) -> float:
-        if not self.opponent_data:
-            return 60.0
-        return max(d['estimated_budget'] for d in self.opponent_data.values())
-    
-    def _get_avg_opponent_aggression(self) -> float:
-        """Average aggression probability across active opponents."""
-        active = [d for d in self.opponent_data.values() if d['estimated_budget'] > 5]
-        if not active:
-            return 0.3
-        return sum(d['p_aggressive'] for d in active) / len(active)
-    
-    def _get_remaining_values(self) -> List[float]:
-        """Get list of our values for unseen items."""
-        return [v for item_id, v in self.valuation_vector.items() if item_id not in self.items_seen]
-    
-    def _is_likely_competitive_item(self, my_valuation: float) -> bool:
-        """
-        Estimate if this item is "high-value-for-all" (competitive) or "mixed" (might be unique to us).
-        Use our valuation as signal + market history.
+    def _summarize_opponents(self):
+        """(active count, max budget, avg aggression) in one array pass.
+
+        Active means estimated budget > 5; the aggression average falls
+        back to 0.3 when nobody is active, and the max budget to 60
+        when there are no opponents at all.
         """
-        # High values (>14) often come from "high-value-for-all" category
-        if my_valuation > 14:
-            return True
-        
-        # If we've seen many high-price auctions, market is competitive
-        if self.high_competition_count > self.low_competition_count + 2:
-            return my_valuation > 10
-        
-        return False
+        budgets = self.opp_budget
+        if not budgets.size:
+            return 0, 60.0, 0.3
+        active = budgets > 5
+        n_active = int(active.sum())
+        max_budget = float(budgets.max())
+        if n_active:
+            avg_aggression = float(self.opp_beliefs[active, 0].mean())
+        else:
+            avg_aggression = 0.3
+        return n_active, max_budget, avg_aggression
     
     # ========== CORE BIDDING LOGIC ==========
     
     def bidding_function(self, item_id: str) -> float:
-        my_valuation = self.valuation_vector.get(item_id, 0)
-        rounds_left = self.total_rounds - self.rounds_completed
-        
-        # Edge cases
-        if my_valuation <= 0:
-            return 0.0
-        if self.budget <= 0.01:
+        # One lookup fetches the valuation and its precomputed shade
+        info = self._item_info.get(item_id)
+        rounds_left = self.rounds_left
+
+        # Edge cases, folded into one short-circuit gate
+        if info is None or self.budget <= 0.01 or rounds_left <= 0:
             return 0.0
-        if rounds_left <= 0:
+        my_valuation, shade = info
+        if my_valuation <= 0:
             return 0.0
-        
-        bid = self._calculate_bid(my_valuation, rounds_left)
-        self.my_bids[item_id] = bid
+
+        bid = self._calculate_bid(my_valuation, shade, rounds_left)
+        self.last_bid_item = item_id
+        self.last_bid = bid
         return float(bid)
-    
-    def _calculate_bid(self, my_valuation: float, rounds_left: int) -> float:
+
+    def bidding_function_batch(self, item_ids: List[str]) -> np.ndarray:
         """
-        IMPROVED BIDDING LOGIC v2
-        
-        Key changes:
-        1. Higher base shading (85-95% instead of 55-85%)
-        2. Guaranteed minimum spend per round
-        3. Never skip items in late game
-        4. Aggressive budget utilization
+        Batch what-if evaluation: the bid for every listed item at the
+        current game state, computed as one vectorized NumPy pass
+        instead of one bidding_function call per item. Does not record
+        a last bid.
         """
-        
-        active_opps = self._get_active_opponents()
-        max_opp_budget = self._get_max_opponent_budget()
-        avg_aggression = self._get_avg_opponent_aggression()
-        is_competitive = self._is_likely_competitive_item(my_valuation)
-        remaining_values = self._get_remaining_values()
-        
-        # Budget we MUST spend per round to not waste it
-        min_spend_rate = self.budget / rounds_left
-        
-        # ===== PHASE 1: DETERMINE BASE SHADE =====
-        # Much less shading than before! Near-truthful is better in Vickrey
-        
-        if my_valuation >= self.top_tier_threshold:
-            # TOP TIER ITEM: We really want this
-            shade = 0.92
-        elif my_valuation >= self.avg_value:
-            # ABOVE AVERAGE: Worth competing for
-            shade = 0.88
-        elif my_valuation >= self.avg_value * 0.5:
-            # BELOW AVERAGE but not trash
-            shade = 0.82
-        else:
-            # LOW VALUE
-            shade = 0.75
-        
-        bid = my_valuation * shade
-        
-        # ===== PHASE 2: COMPETITION ADJUSTMENT =====
-        
-        if is_competitive:
-            # Likely "high-value-for-all" - everyone wants it
-            # Bid higher to compete, but cap at valuation
-            bid = min(my_valuation * 0.95, bid * 1.1)
-        
+        n = len(item_ids)
+        vals = np.array([self.valuation_vector.get(i, 0.0)
+                         for i in item_ids])
+        rounds_left = self.rounds_left
+        if self.budget <= 0.01 or rounds_left <= 0:
+            return np.zeros(n)
+
+        budget = self.budget
+        rem_count = self.remaining_count
+        rem_avg = self.remaining_sum / rem_count if rem_count else 0.0
+
+        # Phase 1: precomputed per-item shades
+        shades = np.array([self._item_info[i][1] if i in self._item_info
+                           else 0.75 for i in item_ids])
+        bids = vals * shades
+
+        # Phase 2: competition adjustment
+        market_hot = (self.high_competition_count
+                      > self.low_competition_count + 2)
+        competitive = (vals > 14) | (market_hot & (vals > 10))
+        bids = np.where(competitive,
+                        np.minimum(vals * 0.95, bids * 1.1), bids)
+
+        active_opps, max_opp_budget, avg_aggression = \
+            self._summarize_opponents()
         if avg_aggression > 0.5:
-            # Aggressive field - need to bid higher
-            bid *= 1.05
+            bids *= 1.05
         elif avg_aggression < 0.25:
-            # Passive field - can shade more
-            bid *= 0.95
-        
-        # ===== PHASE 3: OPPONENT BUDGET AWARENESS =====
-        
+            bids *= 0.95
+
+        # Phase 3: opponent budget awareness
         if active_opps <= 1:
-            # Few threats - we can relax a bit
-            bid *= 0.92
-        
-        if max_opp_budget < 20:
-            # Opponents running low
-            bid = min(bid, max_opp_budget + 5)
-        
+            bids *= 0.92
         if max_opp_budget < 10:
-            # Opponents nearly broke - bid just enough to win
-            bid = min(bid, max_opp_budget + 2)
-        
-        # ===== PHASE 4: BUDGET UTILIZATION (CRITICAL!) =====
-        # This is where v1 failed - we must spend our budget!
-        
-        # Calculate what we SHOULD spend this round
-        target_spend = self._get_target_spend(rounds_left, my_valuation, remaining_values)
-        
-        # If we're under-spending, boost the bid
-        if bid < target_spend and my_valuation > target_spend * 0.8:
-            bid = max(bid, target_spend)
-        
-        # ===== PHASE 5: LATE GAME RULES (NEVER LEAVE BUDGET!) =====
-        
+            bids = np.minimum(bids, max_opp_budget + 2)
+        elif max_opp_budget < 20:
+            bids = np.minimum(bids, max_opp_budget + 5)
+
+        # Phase 4: budget utilization (vectorized _get_target_spend)
+        base_rate = budget / rounds_left
+        if rem_count:
+            quality = np.where(vals > rem_avg,
+                               np.minimum(1.5, vals / rem_avg),
+                               np.maximum(0.7, vals / rem_avg))
+        else:
+            quality = 1.0
+        target = base_rate * quality * self._urgency_table[rounds_left]
+        bids = np.where((bids < target) & (vals > target * 0.8),
+                        target, bids)
+
+        # Phase 5: late game rules
         if rounds_left <= 6:
-            # Getting late - ensure we're spending
-            min_bid = min_spend_rate * 0.7
-            if my_valuation > min_bid:
-                bid = max(bid, min_bid)
-        
+            min_bid = base_rate * 0.7
+            bids = np.where(vals > min_bid, np.maximum(bids, min_bid),
+                            bids)
         if rounds_left <= 4:
-            # Late game - bid on ANY positive value item
-            if my_valuation > 0:
-                # Must spend at least 1/rounds_left of budget
-                forced_min = self.budget / rounds_left
-                bid = max(bid, min(forced_min, my_valuation))
-        
+            bids = np.where(vals > 0,
+                            np.maximum(bids, np.minimum(base_rate, vals)),
+                            bids)
         if rounds_left <= 2:
-            # Very late - aggressive spending
-            if my_valuation > 0:
-                # Spend at least 40% of remaining budget
-                bid = max(bid, min(self.budget * 0.4, my_valuation))
-        
+            bids = np.where(vals > 0,
+                            np.maximum(bids,
+                                       np.minimum(budget * 0.4, vals)),
+                            bids)
         if rounds_left == 1:
-            # LAST ROUND - spend everything (up to valuation)
-            bid = min(my_valuation, self.budget)
-        
-        # ===== PHASE 6: PRIORITY BOOST =====
-        
-        # Is this item better than what we expect to see?
-        if remaining_values:
-            expected_future_avg = sum(remaining_values) / len(remaining_values)
-            if my_valuation > expected_future_avg * 1.3:
-                # This is a great opportunity - boost bid
-                bid = min(bid * 1.1, my_valuation * 0.98)
+            bids = np.minimum(vals, budget)
+
+        # Phase 6: priority boost
+        if rem_count:
+            bids = np.where(vals > rem_avg * 1.3,
+                            np.minimum(bids * 1.1, vals * 0.98), bids)
+
+        # Final constraints, and zero bids for worthless items
+        bids = np.clip(bids, 0.0, np.minimum(budget, vals))
+        bids[vals <= 0.0] = 0.0
+        return bids
+    
+    def _calculate_bid(self, my_valuation: float, shade: float,
+                       rounds_left: int) -> float:
+        """
+        IMPROVED BIDDING LOGIC v2
         
-        # ===== FINAL CONSTRAINTS =====
-        # Never bid more than valuation (guarantees non-negative utility if we win)
-        # Never bid more than budget
-        bid = max(0.0, min(bid, self.budget, my_valuation))
+        Key changes:
+        1. Higher base shading (85-95% instead of 55-85%)
+        2. Guaranteed minimum spend per round
+        3. Never skip items in late game
+        4. Aggressive budget utilization
+        """
         
-        return bid
+        # Gather the scalar inputs, then delegate all the phase
+        # arithmetic to the (optionally JIT-compiled) module-level kernel
+        rem_count = self.remaining_count
+        rem_avg = self.remaining_sum / rem_count if rem_count else 0.0
+        active_opps, max_opp_budget, avg_aggression = \
+            self._summarize_opponents()
+
+        return _bid_kernel(
+            my_valuation, rounds_left, self.budget, shade,
+            self.high_competition_count, self.low_competition_count,
+            avg_aggression, active_opps, max_opp_budget,
+            self._get_target_spend(rounds_left, my_valuation),
+            rem_count, rem_avg)
     
-    def _get_target_spend(self, rounds_left: int, current_val: float, 
-                          remaining_values: List[float]) -> float:
+    def _get_target_spend(self, rounds_left: int, current_val: float) -> float:
         """
         Calculate target spend for this round based on:
         - Even budget distribution
@@ -335,8 +470,8 @@ class BiddingAgent:
         base_rate = self.budget / rounds_left
         
         # If current item is above average of remaining, spend more
-        if remaining_values:
-            avg_remaining = sum(remaining_values) / len(remaining_values)
+        if self.remaining_count:
+            avg_remaining = self.remaining_sum / self.remaining_count
             if current_val > avg_remaining:
                 quality_mult = min(1.5, current_val / avg_remaining)
             else:
@@ -345,11 +480,4 @@ class BiddingAgent:
             quality_mult = 1.0
         
         # Urgency multiplier - spend more as time runs out
-        if rounds_left <= 3:
-            urgency = 1.3
-        elif rounds_left <= 5:
-            urgency = 1.15
-        else:
-            urgency = 1.0
-        
-        return base_rate * quality_mult * urgency
+        return base_rate * quality_mult * self._urgency_table[rounds_left]
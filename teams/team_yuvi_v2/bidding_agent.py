@@ -20,8 +20,130 @@ KEY INSIGHT: If our value is HIGH but price is LOW → we have UNIQUE value (Mix
             This is a golden opportunity for high profit margin!
 """
 
+import collections
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Integer codes for _predict_item_category results, so the kernel
+# branches on ints instead of strings
+_CAT_HIGH_FOR_ALL = 0
+_CAT_LOW_FOR_ALL = 1
+_CAT_MIXED = 2
+
+# Integer codes for _infer_category results; downstream checks become
+# machine-word compares instead of string equality
+_INF_HIGH_FOR_ALL = 0
+_INF_LOW_FOR_ALL = 1
+_INF_MIXED_UNIQUE_TO_US = 2
+_INF_MIXED_UNIQUE_TO_OTHERS = 3
+_INF_MIXED_NEUTRAL = 4
+
+# Lightweight record for _estimate_remaining_categories; attribute reads
+# are cheaper than dict lookups and the fields are fixed
+RemCats = collections.namedtuple(
+    "RemCats",
+    "high_for_all low_for_all mixed expected_remaining "
+    "prob_next_high prob_next_low prob_next_mixed",
+)
+
+
+@njit(cache=True, fastmath=True)
+def _category_bid_kernel(my_valuation, base_bid, rounds_left, budget,
+                         initial_budget, total_rounds,
+                         active_opps, max_opp_budget, avg_aggression,
+                         rem_sum, rem_count, remaining_high,
+                         expected_competitive, is_unique, predicted_cat,
+                         n_items_won):
+    """Scalar core of _calculate_bid, compiled when numba is available."""
+    # ===== BUDGET PACING (CRITICAL FIX!) =====
+    budget_per_round_target = budget / rounds_left
+    spent_so_far = initial_budget - budget
+    rounds_done = total_rounds - rounds_left
+
+    expected_spent = (rounds_done / total_rounds) * initial_budget
+    budget_surplus = expected_spent - spent_so_far  # positive = underspent
+
+    if rounds_left > 8:  # Early game: conservative
+        max_round_spend = 6.0 + max(0.0, budget_surplus * 0.3)
+    elif rounds_left > 4:  # Mid game: moderate
+        max_round_spend = 8.0 + max(0.0, budget_surplus * 0.5)
+    else:  # Late game: aggressive
+        max_round_spend = budget_per_round_target * 1.5
+
+    # ===== PHASE 1: BASE SHADE =====
+    # The shade tier depends only on the (fixed) valuation vector, so
+    # base_bid = valuation * shade is precomputed per item in __init__
+    bid = base_bid
+
+    # ===== PHASE 2: CATEGORY-BASED ADJUSTMENT =====
+    if is_unique:
+        bid = my_valuation * 0.85
+    elif predicted_cat == _CAT_HIGH_FOR_ALL:
+        bid = min(my_valuation * 0.80, bid)
+        if n_items_won >= 2:
+            bid *= 0.85
+    elif predicted_cat == _CAT_LOW_FOR_ALL:
+        bid = min(my_valuation * 0.75, bid)
+
+    # ===== PHASE 3: REMAINING ITEMS STRATEGY =====
+    if remaining_high <= 1 and my_valuation > 12:
+        bid = max(bid, my_valuation * 0.85)
+
+    if expected_competitive > 4:
+        bid = min(bid, my_valuation * 0.80)
+
+    # ===== PHASE 4: OPPONENT AWARENESS =====
+    if avg_aggression > 0.5:
+        bid *= 1.03
+    elif avg_aggression < 0.25:
+        bid *= 0.95
+
+    if active_opps <= 1:
+        bid *= 0.90
+
+    if max_opp_budget < 15:
+        bid = min(bid, max_opp_budget + 3)
+
+    if max_opp_budget < 8:
+        bid = min(bid, max_opp_budget + 1)
+
+    # ===== PHASE 5: BUDGET PACING ENFORCEMENT =====
+    if rounds_left > 4:
+        bid = min(bid, max_round_spend)
+
+    # ===== PHASE 6: LATE GAME SPENDING =====
+    if rounds_left <= 4:
+        min_spend = budget / rounds_left * 0.7
+        if my_valuation > min_spend:
+            bid = max(bid, min(min_spend, my_valuation))
+
+    if rounds_left <= 2:
+        if my_valuation > 0:
+            bid = max(bid, min(budget * 0.45, my_valuation))
+
+    if rounds_left == 1:
+        bid = min(my_valuation, budget)
+
+    # ===== PHASE 7: OPPORTUNITY BOOST =====
+    if rem_count > 0:
+        expected_future_avg = rem_sum / rem_count
+        if my_valuation > expected_future_avg * 1.3:
+            bid = min(bid * 1.1, my_valuation * 0.98)
+
+    # ===== FINAL CONSTRAINTS =====
+    return max(0.0, min(bid, budget, my_valuation))
+
 
 class BiddingAgent:
     """Category-aware adaptive agent with remaining item estimation."""
@@ -40,40 +162,37 @@ class BiddingAgent:
         self.opponent_teams = opponent_teams
         self.utility = 0
         self.items_won = []
+        # Win count as a plain int so the bid path avoids touching the list
+        self.items_won_count = 0
 
         self.rounds_completed = 0
         self.total_rounds = 15
 
         # ===== OPPONENT TRACKING =====
-        self.opponent_data = {
-            opp: {
-                "estimated_budget": 60.0,
-                "items_won": 0,
-                "total_spent": 0.0,
-                "win_prices": [],
-                "p_aggressive": 0.33,
-                "p_truthful": 0.34,
-                "p_passive": 0.33,
-            }
-            for opp in opponent_teams
-        }
+        # Struct-of-arrays indexed through opp_index, like the v1/v4
+        # agents: aggregate queries become vectorized reductions and the
+        # belief update touches one row instead of a nested dict
+        n_opp = len(opponent_teams)
+        self.opp_index = {opp: i for i, opp in enumerate(opponent_teams)}
+        self.opp_budget = np.full(n_opp, 60.0)
+        self.opp_items_won = np.zeros(n_opp, dtype=np.int64)
+        self.opp_spent = np.zeros(n_opp)
+        # Belief columns: [p_aggressive, p_truthful, p_passive]
+        self.opp_beliefs = np.tile(np.array([0.33, 0.34, 0.33]), (n_opp, 1))
 
         # ===== MARKET & HISTORY TRACKING =====
         self.price_history = []
+        self.price_sum = 0.0  # running sum; the mean is one division
         self.my_bids = {}
-        self.auction_results = (
-            []
-        )  # (item_id, winner, price, my_bid, my_val, inferred_category)
         self.items_seen = set()
 
         # ===== CATEGORY INFERENCE (NEW!) =====
         # Expected counts: 6 High-for-ALL, 4 Low-for-ALL, 10 Mixed
-        self.category_counts = {
-            "high_for_all": 0,  # Items where price > 10 AND our_val > 10
-            "low_for_all": 0,  # Items where price < 7 AND our_val < 8
-            "mixed_competitive": 0,  # Mixed items that sold high
-            "mixed_cheap": 0,  # Mixed items that sold low (opportunity!)
-        }
+        # Plain int counters (no dict hashing on the per-round path)
+        self.seen_high_for_all = 0  # Items where price > 10 AND our_val > 10
+        self.seen_low_for_all = 0  # Items where price < 7 AND our_val < 8
+        self.seen_mixed_competitive = 0  # Mixed items that sold high
+        self.seen_mixed_cheap = 0  # Mixed items that sold low (opportunity!)
 
         # Track per-item inferred categories
         self.item_categories = {}  # item_id -> inferred category
@@ -81,15 +200,56 @@ class BiddingAgent:
         # Track "golden opportunities" - items where we had unique high value
         self.unique_value_wins = 0
 
+        # ===== PER-ROUND MEMOIZATION =====
+        # _calculate_bid consults the category estimates several times
+        # per bid; the underlying state only changes between rounds, so the
+        # result is cached until update_after_each_round invalidates it
+        self._cat_cache = None
+
         # ===== VALUE ANALYSIS =====
-        values = sorted(valuation_vector.values(), reverse=True)
-        self.sorted_values = values
-        self.avg_value = sum(values) / len(values)
-        self.median_value = values[len(values) // 2]
-        self.total_value = sum(values)
-        self.top_tier_threshold = (
-            values[int(len(values) * 0.3)] if len(values) > 3 else values[0]
+        # Only a handful of order statistics are needed, so select them
+        # with np.partition (O(n)) instead of fully sorting the vector.
+        # Indices mirror the old descending sort: descending rank k is
+        # ascending rank n - 1 - k.
+        values_np = np.fromiter(valuation_vector.values(), dtype=np.float64)
+        n = values_np.size
+        self.total_value = float(values_np.sum())
+        self.avg_value = self.total_value / n
+        self.median_value = float(
+            np.partition(values_np, n - 1 - n // 2)[n - 1 - n // 2]
         )
+        if n > 3:
+            k = n - 1 - int(n * 0.3)
+            self.top_tier_threshold = float(np.partition(values_np, k)[k])
+        else:
+            self.top_tier_threshold = float(values_np.max())
+
+        # Running stats over not-yet-auctioned items, retired on first
+        # sight in update_after_each_round instead of rescanning the
+        # valuation vector on every bid
+        self.remaining_sum = self.total_value
+        self.remaining_count = n
+        self.remaining_max = float(values_np.max())
+
+        # Per-item base bids: the Phase 1 shade tier only depends on the
+        # valuation vector and the thresholds above, so the shaded base
+        # is a table lookup at bid time. Constant per game, rebuilt in
+        # __init__ (underscore: never serialized between rounds).
+        self._per_item_base = {}
+        for iid, v in valuation_vector.items():
+            if v >= self.top_tier_threshold:
+                shade = 0.88
+            elif v >= self.avg_value:
+                shade = 0.84
+            elif v >= self.avg_value * 0.5:
+                shade = 0.78
+            else:
+                shade = 0.70
+            self._per_item_base[iid] = v * shade
+
+        # Opponent aggregates, recomputed once per round instead of on
+        # every bid (three dict traversals fused into one pass)
+        self._recompute_opponent_aggregates()
 
     def _update_available_budget(
         self, item_id: str, winning_team: str, price_paid: float
@@ -97,70 +257,75 @@ class BiddingAgent:
         if winning_team == self.team_id:
             self.budget -= price_paid
             self.items_won.append(item_id)
+            self.items_won_count += 1
 
-    def _infer_category(self, my_val: float, price_paid: float, i_won: bool) -> str:
+    def _infer_category(self, my_val: float, price_paid: float, i_won: bool) -> int:
         """
         Infer the likely category of an item based on signals.
 
-        Logic:
+        Logic (returns the matching _INF_* code):
         - High price (>10) + High our_val (>10) → likely "High-for-ALL"
         - Low price (<7) + Low our_val (<8) → likely "Low-for-ALL"
         - High our_val + Low price → "Mixed" where we got lucky (OPPORTUNITY!)
         - Low our_val + High price → "Mixed" where others got lucky
         """
         if my_val > 10 and price_paid > 10:
-            return "high_for_all"
+            return _INF_HIGH_FOR_ALL
         elif my_val < 8 and price_paid < 7:
-            return "low_for_all"
+            return _INF_LOW_FOR_ALL
         elif my_val > 12 and price_paid < 8:
             # We had high value but it sold cheap - UNIQUE VALUE opportunity
-            return "mixed_unique_to_us"
+            return _INF_MIXED_UNIQUE_TO_US
         elif my_val < 8 and price_paid > 10:
             # We had low value but it sold high - others wanted it
-            return "mixed_unique_to_others"
+            return _INF_MIXED_UNIQUE_TO_OTHERS
         else:
-            return "mixed_neutral"
+            return _INF_MIXED_NEUTRAL
 
     def _bayesian_update(self, winning_team: str, price_paid: float, my_bid: float):
         """Update beliefs about opponent types."""
         avg_price = (
-            sum(self.price_history) / len(self.price_history)
+            self.price_sum / len(self.price_history)
             if self.price_history
             else 10
         )
 
         if not winning_team or winning_team == self.team_id:
-            for opp_id, data in self.opponent_data.items():
-                data["p_passive"] = min(0.7, data["p_passive"] + 0.02)
-                self._normalize_beliefs(data)
+            np.minimum(self.opp_beliefs[:, 2] + 0.02, 0.7,
+                       out=self.opp_beliefs[:, 2])
+            self._normalize_beliefs()
             return
 
-        if winning_team not in self.opponent_data:
+        idx = self.opp_index.get(winning_team)
+        if idx is None:
             return
 
-        opp = self.opponent_data[winning_team]
+        opp = self.opp_beliefs[idx]
 
         if price_paid > avg_price * 1.2:
-            opp["p_aggressive"] = min(0.85, opp["p_aggressive"] * 1.3)
-            opp["p_passive"] *= 0.8
+            opp[0] = min(0.85, opp[0] * 1.3)
+            opp[2] *= 0.8
         elif price_paid < avg_price * 0.7:
-            opp["p_passive"] = min(0.7, opp["p_passive"] * 1.2)
+            opp[2] = min(0.7, opp[2] * 1.2)
         else:
-            opp["p_truthful"] = min(0.7, opp["p_truthful"] * 1.15)
+            opp[1] = min(0.7, opp[1] * 1.15)
 
         if my_bid > 0 and price_paid > my_bid:
-            opp["p_aggressive"] = min(0.85, opp["p_aggressive"] * 1.2)
+            opp[0] = min(0.85, opp[0] * 1.2)
 
-        self._normalize_beliefs(opp)
+        self._normalize_beliefs(idx)
 
-    def _normalize_beliefs(self, opp_data: dict):
-        total = (
-            opp_data["p_aggressive"] + opp_data["p_truthful"] + opp_data["p_passive"]
-        )
-        if total > 0:
-            opp_data["p_aggressive"] /= total
-            opp_data["p_truthful"] /= total
-            opp_data["p_passive"] /= total
+    def _normalize_beliefs(self, idx: int = None):
+        """Renormalize one belief row, or every row when idx is None."""
+        if idx is None:
+            totals = self.opp_beliefs.sum(axis=1, keepdims=True)
+            np.divide(self.opp_beliefs, totals, out=self.opp_beliefs,
+                      where=totals > 0)
+        else:
+            row = self.opp_beliefs[idx]
+            total = row.sum()
+            if total > 0:
+                row /= total
 
     def update_after_each_round(
         self, item_id: str, winning_team: str, price_paid: float
@@ -168,7 +333,11 @@ class BiddingAgent:
         self._update_available_budget(item_id, winning_team, price_paid)
         self.rounds_completed += 1
 
-        my_val = self.valuation_vector.get(item_id, 0)
+        # Bind the hot attributes once (locals are cheaper to read)
+        vv = self.valuation_vector
+        seen = self.items_seen
+
+        my_val = vv.get(item_id, 0)
         my_bid = self.my_bids.get(item_id, 0)
         i_won = winning_team == self.team_id
 
@@ -177,73 +346,94 @@ class BiddingAgent:
         self.item_categories[item_id] = inferred_cat
 
         # Update category counts
-        if inferred_cat == "high_for_all":
-            self.category_counts["high_for_all"] += 1
-        elif inferred_cat == "low_for_all":
-            self.category_counts["low_for_all"] += 1
-        elif inferred_cat == "mixed_unique_to_us":
-            self.category_counts["mixed_cheap"] += 1
+        if inferred_cat == _INF_HIGH_FOR_ALL:
+            self.seen_high_for_all += 1
+        elif inferred_cat == _INF_LOW_FOR_ALL:
+            self.seen_low_for_all += 1
+        elif inferred_cat == _INF_MIXED_UNIQUE_TO_US:
+            self.seen_mixed_cheap += 1
             if i_won:
                 self.unique_value_wins += 1
         else:
-            self.category_counts["mixed_competitive"] += 1
+            self.seen_mixed_competitive += 1
 
         # Record history
         self.price_history.append(price_paid)
-        self.auction_results.append(
-            (item_id, winning_team, price_paid, my_bid, my_val, inferred_cat)
-        )
-        self.items_seen.add(item_id)
+        self.price_sum += price_paid
+        if item_id not in seen:
+            seen.add(item_id)
+            retired = vv.get(item_id)
+            if retired is not None:
+                self.remaining_sum -= retired
+                self.remaining_count -= 1
+                if retired >= self.remaining_max:
+                    self.remaining_max = max(
+                        (v for iid, v in vv.items() if iid not in seen),
+                        default=0.0,
+                    )
 
         # Update opponent data
         if winning_team and winning_team != self.team_id:
-            if winning_team in self.opponent_data:
-                opp = self.opponent_data[winning_team]
-                opp["estimated_budget"] -= price_paid
-                opp["items_won"] += 1
-                opp["total_spent"] += price_paid
-                opp["win_prices"].append(price_paid)
+            idx = self.opp_index.get(winning_team)
+            if idx is not None:
+                self.opp_budget[idx] -= price_paid
+                self.opp_items_won[idx] += 1
+                self.opp_spent[idx] += price_paid
 
         self._bayesian_update(winning_team, price_paid, my_bid)
+        self._recompute_opponent_aggregates()
+
+        # Round state changed - drop the per-round cache
+        self._cat_cache = None
         return True
 
     # ========== HELPER METHODS ==========
 
+    def _recompute_opponent_aggregates(self):
+        """Vectorized reductions caching the per-bid opponent aggregates."""
+        b = self.opp_budget
+        if b.size == 0:
+            self.active_opps = 0
+            self.max_opp_budget = 60.0
+            self.avg_opp_aggression = 0.3
+            return
+        active = b > 5
+        active_count = int(active.sum())
+        self.active_opps = active_count
+        self.max_opp_budget = float(b.max())
+        self.avg_opp_aggression = (
+            float(self.opp_beliefs[active, 0].sum()) / active_count
+            if active_count
+            else 0.3
+        )
+
     def _get_active_opponents(self) -> int:
-        return sum(1 for d in self.opponent_data.values() if d["estimated_budget"] > 5)
+        return self.active_opps
 
     def _get_max_opponent_budget(self) -> float:
-        if not self.opponent_data:
-            return 60.0
-        return max(d["estimated_budget"] for d in self.opponent_data.values())
+        return self.max_opp_budget
 
     def _get_avg_opponent_aggression(self) -> float:
-        active = [d for d in self.opponent_data.values() if d["estimated_budget"] > 5]
-        if not active:
-            return 0.3
-        return sum(d["p_aggressive"] for d in active) / len(active)
-
-    def _get_remaining_values(self) -> List[float]:
-        return [
-            v
-            for item_id, v in self.valuation_vector.items()
-            if item_id not in self.items_seen
-        ]
-
-    def _estimate_remaining_categories(self) -> Dict[str, float]:
+        return self.avg_opp_aggression
+
+    def _get_remaining_stats(self) -> Tuple[float, int, float]:
+        """(sum, count, max) over items not yet auctioned, in O(1)."""
+        return self.remaining_sum, self.remaining_count, self.remaining_max
+
+    def _estimate_remaining_categories(self) -> RemCats:
         """
         Estimate how many items of each category are likely remaining.
         Based on: 6 High-for-ALL, 4 Low-for-ALL, 10 Mixed (of which 15 total auctioned)
 
-        Returns expected counts with fractional estimates.
+        Returns expected counts with fractional estimates as a RemCats record.
         """
+        if self._cat_cache is not None:
+            return self._cat_cache
+
         # How many of each we've likely seen
-        seen_high = self.category_counts["high_for_all"]
-        seen_low = self.category_counts["low_for_all"]
-        seen_mixed = (
-            self.category_counts["mixed_cheap"]
-            + self.category_counts["mixed_competitive"]
-        )
+        seen_high = self.seen_high_for_all
+        seen_low = self.seen_low_for_all
+        seen_mixed = self.seen_mixed_cheap + self.seen_mixed_competitive
 
         # Expected remaining (can't go below 0)
         # Note: 5 items won't be auctioned at all
@@ -263,110 +453,53 @@ class BiddingAgent:
         else:
             prob_high = prob_low = prob_mixed = 0.33
 
-        return {
-            "high_for_all": remaining_high,
-            "low_for_all": remaining_low,
-            "mixed": remaining_mixed,
-            "expected_remaining": total_remaining,
-            "prob_next_high": prob_high,
-            "prob_next_low": prob_low,
-            "prob_next_mixed": prob_mixed,
-        }
-
-    def _estimate_remaining_value_stats(self) -> Dict[str, float]:
-        """
-        Estimate statistics about remaining item values.
-        Uses category estimates to predict what's coming.
-        """
-        remaining_cats = self._estimate_remaining_categories()
-        remaining_own_values = self._get_remaining_values()
-
-        if not remaining_own_values:
-            return {"avg": 10, "max": 15, "expected_competitive": 5}
-
-        # Our remaining average
-        our_remaining_avg = sum(remaining_own_values) / len(remaining_own_values)
-        our_remaining_max = max(remaining_own_values)
-
-        # Estimate competition level
-        # High-for-all items are guaranteed competitive (everyone values 10-20)
-        expected_competitive = remaining_cats["high_for_all"]
-
-        # Mixed items have ~50% chance of being competitive (when others also high)
-        expected_competitive += remaining_cats["mixed"] * 0.3
-
-        return {
-            "our_avg": our_remaining_avg,
-            "our_max": our_remaining_max,
-            "expected_competitive_items": expected_competitive,
-            "expected_low_competition_items": remaining_cats["low_for_all"]
-            + remaining_cats["mixed"] * 0.5,
-        }
+        self._cat_cache = RemCats(
+            high_for_all=remaining_high,
+            low_for_all=remaining_low,
+            mixed=remaining_mixed,
+            expected_remaining=total_remaining,
+            prob_next_high=prob_high,
+            prob_next_low=prob_low,
+            prob_next_mixed=prob_mixed,
+        )
+        return self._cat_cache
 
-    def _predict_item_category(self, my_valuation: float) -> str:
+    def _analyze_item(self, my_valuation: float) -> Tuple[int, bool]:
         """
-        Predict the likely category of the current item based on our valuation.
-
-        Returns: 'likely_high_for_all', 'likely_low_for_all', 'likely_mixed', 'unknown'
+        One fused pass over the category estimates for the current item.
+
+        Returns (predicted _CAT_* code, is_likely_unique_opportunity):
+        - The prediction is based on our valuation vs what's likely left
+          (high value + competitive items remaining -> High-for-ALL;
+          low value + low-tier items remaining -> Low-for-ALL; else Mixed).
+        - "Unique opportunity": we have high value and the market pattern
+          suggests a Mixed item others don't want.
         """
         remaining = self._estimate_remaining_categories()
 
         if my_valuation >= 15:
             # Very high value - could be High-for-ALL or lucky Mixed
-            if remaining["high_for_all"] >= 2:
-                return "likely_high_for_all"  # Still many competitive items left
+            if remaining.high_for_all >= 2:
+                prediction = _CAT_HIGH_FOR_ALL  # Many competitive items left
             else:
-                return "likely_mixed"  # Most competitive items passed
-
+                prediction = _CAT_MIXED  # Most competitive items passed
         elif my_valuation <= 5:
             # Very low value - could be Low-for-ALL or unlucky Mixed
-            if remaining["low_for_all"] >= 2:
-                return "likely_low_for_all"
+            if remaining.low_for_all >= 2:
+                prediction = _CAT_LOW_FOR_ALL
             else:
-                return "likely_mixed"
-
+                prediction = _CAT_MIXED
         else:
             # Mid-range value - hard to tell
-            return "likely_mixed"
-
-    def _is_likely_unique_opportunity(self, my_valuation: float) -> bool:
-        """
-        Detect if this item might be a "unique value" opportunity for us.
-        If we have high value and market pattern suggests Mixed category.
-        """
-        remaining = self._estimate_remaining_categories()
-
-        if my_valuation >= 14:
-            # High value for us
-            # If most High-for-ALL items have passed, this might be Mixed where we're lucky
-            if self.category_counts["high_for_all"] >= 4:
-                return True
-            # If we've seen price patterns where our high values didn't correlate with high prices
-            if self.unique_value_wins >= 1:
-                return True  # We've gotten lucky before, might happen again
+            prediction = _CAT_MIXED
 
-        return False
+        # Most High-for-ALL items passed, or our high values have sold
+        # cheap before: likely a Mixed item where we got lucky
+        is_unique = my_valuation >= 14 and (
+            self.seen_high_for_all >= 4 or self.unique_value_wins >= 1
+        )
 
-    def _get_competition_score(self, my_valuation: float) -> float:
-        """
-        Calculate expected competition score (0-1) for this item.
-        Higher = more competition expected.
-        """
-        prediction = self._predict_item_category(my_valuation)
-        remaining = self._estimate_remaining_categories()
-
-        if prediction == "likely_high_for_all":
-            return 0.9  # Very competitive
-        elif prediction == "likely_low_for_all":
-            return 0.3  # Low competition
-        else:
-            # Mixed - estimate based on our value
-            if my_valuation >= 15:
-                return 0.6  # We want it, others might too
-            elif my_valuation <= 8:
-                return 0.4  # We don't want it much
-            else:
-                return 0.5
+        return prediction, is_unique
 
     # ========== CORE BIDDING LOGIC ==========
 
@@ -377,139 +510,143 @@ class BiddingAgent:
         if my_valuation <= 0 or self.budget <= 0.01 or rounds_left <= 0:
             return 0.0
 
-        bid = self._calculate_bid(my_valuation, rounds_left)
+        bid = self._calculate_bid(item_id, my_valuation, rounds_left)
         self.my_bids[item_id] = bid
         return float(bid)
 
-    def _calculate_bid(self, my_valuation: float, rounds_left: int) -> float:
+    def _calculate_bid(
+        self, item_id: str, my_valuation: float, rounds_left: int
+    ) -> float:
         """
         CATEGORY-AWARE BIDDING WITH BUDGET PACING
 
         KEY FIX: Don't spend more than 4-6 budget/round average!
         Budget = 60, Rounds = 15, Target avg = 4/round
+
+        Gathers the scalar inputs (pacing state, value thresholds,
+        opponent aggregates, category estimates) and hands them to the
+        compiled _category_bid_kernel.
         """
 
         active_opps = self._get_active_opponents()
         max_opp_budget = self._get_max_opponent_budget()
         avg_aggression = self._get_avg_opponent_aggression()
-        remaining_values = self._get_remaining_values()
+        rem_sum, rem_count, _ = self._get_remaining_stats()
         remaining_cats = self._estimate_remaining_categories()
-        remaining_stats = self._estimate_remaining_value_stats()
-        is_unique_opportunity = self._is_likely_unique_opportunity(my_valuation)
-        predicted_category = self._predict_item_category(my_valuation)
-
-        # ===== BUDGET PACING (CRITICAL FIX!) =====
-        # Target: spend ~4/round on average (60/15 = 4)
-        # Allow bursts but cap maximum per-round spend based on phase
-
-        budget_per_round_target = self.budget / rounds_left
-        spent_so_far = self.initial_budget - self.budget
+        # High-for-all items are guaranteed competitive; Mixed ones are
+        # competitive ~30% of the time (only field the old value-stats
+        # helper ever fed into the bid)
+        expected_competitive = (remaining_cats.high_for_all
+                                + remaining_cats.mixed * 0.3)
+        cat_code, is_unique_opportunity = self._analyze_item(my_valuation)
+
+        base_bid = self._per_item_base.get(item_id, my_valuation * 0.70)
+
+        return float(_category_bid_kernel(
+            float(my_valuation), float(base_bid), rounds_left,
+            float(self.budget), float(self.initial_budget), self.total_rounds,
+            active_opps, float(max_opp_budget), float(avg_aggression),
+            float(rem_sum), rem_count,
+            float(remaining_cats.high_for_all),
+            float(expected_competitive),
+            is_unique_opportunity, cat_code, self.items_won_count))
+
+    def bidding_function_batch(self, item_ids: List[str]) -> np.ndarray:
+        """Vectorized what-if: category-aware bids for many items at once.
+
+        Mirrors _category_bid_kernel phase by phase with masked array
+        ops; the per-item inputs (valuation, shaded base, predicted
+        category, uniqueness) become arrays while the pacing and
+        opponent terms stay scalar. Does not record my_bids.
+        """
+        n = len(item_ids)
+        rounds_left = self.total_rounds - self.rounds_completed
+        if rounds_left <= 0 or self.budget <= 0.01:
+            return np.zeros(n)
+
+        vals = np.fromiter(
+            (self.valuation_vector.get(i, 0.0) for i in item_ids),
+            dtype=np.float64, count=n)
+        bid = np.fromiter(
+            (self._per_item_base.get(i, 0.0) for i in item_ids),
+            dtype=np.float64, count=n)
+
+        budget = self.budget
+        rc = self._estimate_remaining_categories()
+        expected_competitive = rc.high_for_all + rc.mixed * 0.3
+        rem_sum, rem_count, _ = self._get_remaining_stats()
+
+        # Pacing scalars (same math as the kernel)
+        spent_so_far = self.initial_budget - budget
         rounds_done = self.total_rounds - rounds_left
-
-        # How much SHOULD we have spent by now?
         expected_spent = (rounds_done / self.total_rounds) * self.initial_budget
-        budget_surplus = expected_spent - spent_so_far  # positive = underspent
-
-        # Max we're ALLOWED to spend this round based on pacing
-        if rounds_left > 8:  # Early game: conservative
-            max_round_spend = 6.0 + max(0, budget_surplus * 0.3)
-        elif rounds_left > 4:  # Mid game: moderate
-            max_round_spend = 8.0 + max(0, budget_surplus * 0.5)
-        else:  # Late game: aggressive
-            max_round_spend = budget_per_round_target * 1.5
-
-        # ===== PHASE 1: BASE SHADE =====
-        if my_valuation >= self.top_tier_threshold:
-            shade = 0.88
-        elif my_valuation >= self.avg_value:
-            shade = 0.84
-        elif my_valuation >= self.avg_value * 0.5:
-            shade = 0.78
+        budget_surplus = expected_spent - spent_so_far
+        if rounds_left > 8:
+            max_round_spend = 6.0 + max(0.0, budget_surplus * 0.3)
+        elif rounds_left > 4:
+            max_round_spend = 8.0 + max(0.0, budget_surplus * 0.5)
         else:
-            shade = 0.70
-
-        bid = my_valuation * shade
-
-        # ===== PHASE 2: CATEGORY-BASED ADJUSTMENT =====
-
-        if is_unique_opportunity:
-            # GOLDEN OPPORTUNITY: High value for us, likely Mixed category
-            # Others probably don't want it - bid confidently but paced
-            bid = my_valuation * 0.85
-
-        elif predicted_category == "likely_high_for_all":
-            # Likely High-for-ALL item - TRAP! Everyone wants it
-            # Be MORE conservative - these are expensive to win
-            bid = min(my_valuation * 0.80, bid)
-
-            # If we've already won items, definitely let competitive ones go
-            if len(self.items_won) >= 2:
-                bid *= 0.85
-
-        elif predicted_category == "likely_low_for_all":
-            # Low competition expected - good value opportunity
-            bid = min(my_valuation * 0.75, bid)
-
-        # ===== PHASE 3: REMAINING ITEMS STRATEGY =====
-
-        # If few good items remain, be more aggressive
-        if remaining_cats["high_for_all"] <= 1 and my_valuation > 12:
-            bid = max(bid, my_valuation * 0.85)
-
-        # If many competitive items remain, be patient
-        if remaining_stats["expected_competitive_items"] > 4:
-            bid = min(bid, my_valuation * 0.80)
-
-        # ===== PHASE 4: OPPONENT AWARENESS =====
+            max_round_spend = budget / rounds_left * 1.5
 
+        # Per-item category analysis as masks
+        pred_high = (vals >= 15) & (rc.high_for_all >= 2)
+        pred_low = (vals <= 5) & (rc.low_for_all >= 2)
+        if self.seen_high_for_all >= 4 or self.unique_value_wins >= 1:
+            is_unique = vals >= 14
+        else:
+            is_unique = np.zeros(n, dtype=bool)
+
+        # Phase 2: category adjustments
+        bid = np.where(is_unique, vals * 0.85, bid)
+        high_mask = ~is_unique & pred_high
+        adj = np.minimum(vals * 0.80, bid)
+        if self.items_won_count >= 2:
+            adj = adj * 0.85
+        bid = np.where(high_mask, adj, bid)
+        low_mask = ~is_unique & ~pred_high & pred_low
+        bid = np.where(low_mask, np.minimum(vals * 0.75, bid), bid)
+
+        # Phase 3: remaining items strategy
+        if rc.high_for_all <= 1:
+            bid = np.where(vals > 12, np.maximum(bid, vals * 0.85), bid)
+        if expected_competitive > 4:
+            bid = np.minimum(bid, vals * 0.80)
+
+        # Phase 4: opponent awareness (item-independent scalars)
+        avg_aggression = self.avg_opp_aggression
         if avg_aggression > 0.5:
             bid *= 1.03
         elif avg_aggression < 0.25:
             bid *= 0.95
-
-        if active_opps <= 1:
+        if self.active_opps <= 1:
             bid *= 0.90
-
-        # Exploit weak opponents
+        max_opp_budget = self.max_opp_budget
         if max_opp_budget < 15:
-            bid = min(bid, max_opp_budget + 3)
-
+            bid = np.minimum(bid, max_opp_budget + 3)
         if max_opp_budget < 8:
-            bid = min(bid, max_opp_budget + 1)
-
-        # ===== PHASE 5: BUDGET PACING ENFORCEMENT =====
-        # Cap bid to maintain budget for later rounds
+            bid = np.minimum(bid, max_opp_budget + 1)
 
+        # Phase 5: pacing enforcement
         if rounds_left > 4:
-            # Not late game yet - enforce spending cap
-            bid = min(bid, max_round_spend)
-
-        # ===== PHASE 6: LATE GAME SPENDING =====
+            bid = np.minimum(bid, max_round_spend)
 
+        # Phase 6: late game spending
         if rounds_left <= 4:
-            # Late game - need to spend remaining budget
-            min_spend = self.budget / rounds_left * 0.7
-            if my_valuation > min_spend:
-                bid = max(bid, min(min_spend, my_valuation))
-
+            min_spend = budget / rounds_left * 0.7
+            bid = np.where(vals > min_spend,
+                           np.maximum(bid, np.minimum(min_spend, vals)), bid)
         if rounds_left <= 2:
-            # Very late - be aggressive
-            if my_valuation > 0:
-                bid = max(bid, min(self.budget * 0.45, my_valuation))
-
+            bid = np.where(vals > 0,
+                           np.maximum(bid, np.minimum(budget * 0.45, vals)),
+                           bid)
         if rounds_left == 1:
-            # Last round - spend it all if item is worth it
-            bid = min(my_valuation, self.budget)
-
-        # ===== PHASE 7: OPPORTUNITY BOOST =====
-
-        # If this item is significantly better than remaining expected items
-        if remaining_values:
-            expected_future_avg = sum(remaining_values) / len(remaining_values)
-            if my_valuation > expected_future_avg * 1.3:
-                bid = min(bid * 1.1, my_valuation * 0.98)
+            bid = np.minimum(vals, budget)
 
-        # ===== FINAL CONSTRAINTS =====
-        bid = max(0.0, min(bid, self.budget, my_valuation))
+        # Phase 7: opportunity boost
+        if rem_count > 0:
+            threshold = (rem_sum / rem_count) * 1.3
+            bid = np.where(vals > threshold,
+                           np.minimum(bid * 1.1, vals * 0.98), bid)
 
-        return bid
+        bid = np.maximum(0.0, np.minimum(np.minimum(bid, budget), vals))
+        return np.where(vals > 0, bid, 0.0)
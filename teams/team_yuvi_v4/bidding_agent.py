@@ -30,49 +30,161 @@ PHASE STRATEGY:
 - Late (11-15): DOMINATE - sniper mode, use all budget
 """
 
+import sys
 from typing import Dict, List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _dominator_bid_kernel(my_value, rounds_left, budget, high_value_threshold,
+                          avg_value, avg_half, target_spend, active_threats,
+                          max_opp_budget, rem_count, rem_avg):
+    """Scalar core of _dominator_bid, compiled when numba is available."""
+    min_spend_rate = budget / rounds_left
+
+    # ===== PHASE 1: BASE SHADE (V1 PROVEN - NEAR TRUTHFUL!) =====
+    if my_value >= high_value_threshold:
+        shade = 0.92  # TOP TIER - bid strong!
+    elif my_value >= avg_value:
+        shade = 0.88  # ABOVE AVERAGE
+    elif my_value >= avg_half:
+        shade = 0.82  # BELOW AVERAGE
+    else:
+        shade = 0.75  # LOW VALUE
+
+    bid = my_value * shade
+
+    # ===== PHASE 2: COMPETITION BOOST (FROM V1) =====
+    if my_value > 14:
+        # High value likely wanted by all - bid higher to compete
+        bid = min(my_value * 0.95, bid * 1.1)
+
+    # ===== PHASE 3: LIGHT OPPONENT AWARENESS (SIMPLIFIED!) =====
+    # Only snipe when opponents are REALLY weak
+    if max_opp_budget < 10:
+        bid = min(bid, max_opp_budget + 3)
+
+    if active_threats <= 1:
+        bid *= 0.95  # Few real threats, slight savings
+
+    # ===== PHASE 4: BUDGET UTILIZATION (V1 CORE - CRITICAL!) =====
+    # If under-spending, boost the bid
+    if bid < target_spend and my_value > target_spend * 0.8:
+        bid = max(bid, target_spend)
+
+    # ===== PHASE 5: LATE GAME RULES (V1 - NEVER LEAVE BUDGET!) =====
+    if rounds_left <= 6:
+        # Getting late - ensure we're spending
+        min_bid = min_spend_rate * 0.7
+        if my_value > min_bid:
+            bid = max(bid, min_bid)
+
+    if rounds_left <= 4 and my_value > 0:
+        # Late game - must spend (1/rounds_left of budget)
+        bid = max(bid, min(min_spend_rate, my_value))
+
+    if rounds_left <= 2 and my_value > 0:
+        # Very late - aggressive spending
+        bid = max(bid, min(budget * 0.4, my_value))
+
+    if rounds_left == 1:
+        # LAST ROUND - spend everything!
+        bid = min(my_value, budget)
+
+    # ===== PHASE 6: PRIORITY BOOST (V1) =====
+    if rem_count > 0 and my_value > rem_avg * 1.3:
+        # Great opportunity - boost bid
+        bid = min(bid * 1.1, my_value * 0.98)
+
+    # ===== FINAL CONSTRAINTS =====
+    return max(0.0, min(bid, budget, my_value))
+
 
 class BiddingAgent:
     """THE DOMINATOR - Aggressive counter-all strategy."""
+
+    # Fixed by the competition; class-level so it is a constant, not state
+    TOTAL_ROUNDS = 15
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'items_won', 'rounds_completed',
+                 'opp_index', 'opp_budget', 'opp_threat',
+                 'opp_items_won', 'opp_spent', 'opp_is_aggr',
+                 'opp_is_passive', 'price_history',
+                 'price_sum', 'my_bids', 'items_seen', 'wins_at_high_price',
+                 'wins_at_low_price', 'avg_value',
+                 'high_value_threshold', 'remaining_sum', 'remaining_count',
+                 'max_threat_budget', 'weakest_opp_budget', 'active_threats',
+                 '_avg_half')
     
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.items_won = []
         
         self.rounds_completed = 0
-        self.total_rounds = 15
         
         # ===== OPPONENT INTELLIGENCE =====
-        self.opponent_data = {
-            opp: {
-                'budget': 60.0,
-                'items_won': 0,
-                'total_spent': 0.0,
-                'is_aggressive': False,  # Bids > 90% value
-                'is_passive': False,     # Bids < 70% value
-                'threat_level': 1.0,     # 0-2 scale
-            }
-            for opp in opponent_teams
-        }
+        # Struct-of-arrays: one slot per opponent, indexed via opp_index,
+        # so aggregate queries are vectorized reductions
+        n_opp = len(opponent_teams)
+        self.opp_index = {opp: i for i, opp in enumerate(opponent_teams)}
+        self.opp_budget = np.full(n_opp, 60.0)
+        self.opp_items_won = np.zeros(n_opp, dtype=np.int64)
+        self.opp_spent = np.zeros(n_opp)
+        self.opp_is_aggr = np.zeros(n_opp, dtype=bool)     # Bids > 90% value
+        self.opp_is_passive = np.zeros(n_opp, dtype=bool)  # Bids < 70% value
+        self.opp_threat = np.ones(n_opp)                   # 0-2 scale
         
         # ===== MARKET TRACKING =====
         self.price_history = []
+        self.price_sum = 0.0
         self.my_bids = {}
         self.items_seen = set()
         self.wins_at_high_price = 0  # Times we paid > 12
         self.wins_at_low_price = 0   # Times we paid < 8
         
         # ===== VALUE ANALYSIS =====
-        values = sorted(valuation_vector.values(), reverse=True)
-        self.sorted_values = values
-        self.avg_value = sum(values) / len(values)
-        self.high_value_threshold = values[int(len(values) * 0.3)] if len(values) > 3 else 15
+        # Valuations live in a NumPy array so the one-time aggregates
+        # (mean, threshold) run as C-level reductions; np.partition gives
+        # the top-30% order statistic without sorting the whole array
+        values_np = np.fromiter(valuation_vector.values(), dtype=np.float64)
+        n = len(values_np)
+        self.avg_value = float(values_np.sum() / n)
+        if n > 3:
+            k_top = n - 1 - int(n * 0.3)
+            self.high_value_threshold = float(np.partition(values_np,
+                                                           k_top)[k_top])
+        else:
+            self.high_value_threshold = 15
+        # Game-constant shade boundary, hoisted out of the bid kernel
+        self._avg_half = self.avg_value * 0.5
+
+        # Running stats over not-yet-auctioned items; retired in
+        # update_after_each_round so per-bid aggregates are O(1)
+        self.remaining_sum = sum(valuation_vector.values())
+        self.remaining_count = len(valuation_vector)
+
+        # Opponent aggregates, recomputed once per round instead of on
+        # every bid (three separate dict traversals fused into one pass)
+        self._recompute_opponent_aggregates()
         
     def _update_budget(self, item_id: str, winning_team: str, price_paid: float):
         if winning_team == self.team_id:
@@ -84,6 +196,13 @@ class BiddingAgent:
                 self.wins_at_low_price += 1
     
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
+        # Broke agents bid 0.0 unconditionally, so market and opponent
+        # bookkeeping can no longer influence any future bid - skip it
+        if self.budget <= 0.01 and winning_team != self.team_id:
+            self.rounds_completed += 1
+            return True
+
         self._update_budget(item_id, winning_team, price_paid)
         self.rounds_completed += 1
         
@@ -91,56 +210,73 @@ class BiddingAgent:
         my_bid = self.my_bids.get(item_id, 0)
         
         self.price_history.append(price_paid)
-        self.items_seen.add(item_id)
+        self.price_sum += price_paid
+        if item_id not in self.items_seen:
+            self.items_seen.add(item_id)
+            self.remaining_sum -= self.valuation_vector.get(item_id, 0)
+            self.remaining_count -= 1
         
         # Update opponent data
         if winning_team and winning_team != self.team_id:
-            if winning_team in self.opponent_data:
-                opp = self.opponent_data[winning_team]
-                opp['budget'] -= price_paid
-                opp['items_won'] += 1
-                opp['total_spent'] += price_paid
-                
+            idx = self.opp_index.get(winning_team)
+            if idx is not None:
+                self.opp_budget[idx] -= price_paid
+                self.opp_items_won[idx] += 1
+                self.opp_spent[idx] += price_paid
+
                 # Classify opponent behavior
-                avg_price = sum(self.price_history) / len(self.price_history) if self.price_history else 10
+                avg_price = self.price_sum / len(self.price_history) if self.price_history else 10
+                threat = self.opp_threat[idx]
                 if price_paid > avg_price * 1.3:
-                    opp['is_aggressive'] = True
-                    opp['threat_level'] = min(2.0, opp['threat_level'] + 0.2)
+                    self.opp_is_aggr[idx] = True
+                    threat = min(2.0, threat + 0.2)
                 elif price_paid < avg_price * 0.6:
-                    opp['is_passive'] = True
-                    opp['threat_level'] = max(0.3, opp['threat_level'] - 0.1)
-                
+                    self.opp_is_passive[idx] = True
+                    threat = max(0.3, threat - 0.1)
+
                 # Reduce threat when budget is low
-                if opp['budget'] < 20:
-                    opp['threat_level'] *= 0.7
-                if opp['budget'] < 10:
-                    opp['threat_level'] *= 0.5
-        
+                if self.opp_budget[idx] < 20:
+                    threat *= 0.7
+                if self.opp_budget[idx] < 10:
+                    threat *= 0.5
+                self.opp_threat[idx] = threat
+
+        self._recompute_opponent_aggregates()
         return True
     
     # ========== INTELLIGENCE ==========
     
-    def _get_remaining_values(self) -> List[float]:
-        return [v for item_id, v in self.valuation_vector.items() 
-                if item_id not in self.items_seen]
+    def _get_remaining_stats(self):
+        """(sum, count, avg) over items not yet auctioned, in O(1)."""
+        if self.remaining_count <= 0:
+            return 0.0, 0, 0.0
+        return (self.remaining_sum, self.remaining_count,
+                self.remaining_sum / self.remaining_count)
     
+    def _recompute_opponent_aggregates(self):
+        """Vectorized pass over the SoA caching the per-bid aggregates."""
+        b, t = self.opp_budget, self.opp_threat
+        max_threat = t.max() if t.size else 0.0
+        if max_threat > 0:
+            max_weighted = max(0.0, float((b * t).max()))
+            self.max_threat_budget = max_weighted / max_threat
+        else:
+            self.max_threat_budget = 60.0
+        active = b[b > 3]
+        self.weakest_opp_budget = float(active.min()) if active.size else 0
+        self.active_threats = int(np.count_nonzero((b > 8) & (t > 0.5)))
+
     def _get_max_threat_budget(self) -> float:
-        """Budget of most dangerous opponent."""
-        if not self.opponent_data:
-            return 60.0
-        threats = [(d['budget'], d['threat_level']) for d in self.opponent_data.values()]
-        # Weight by threat level
-        return max(b * t for b, t in threats) / max(t for _, t in threats) if threats else 60
-    
+        """Budget of most dangerous opponent (cached per round)."""
+        return self.max_threat_budget
+
     def _get_weakest_opponent_budget(self) -> float:
-        """Budget of weakest active opponent."""
-        active = [d['budget'] for d in self.opponent_data.values() if d['budget'] > 3]
-        return min(active) if active else 0
-    
+        """Budget of weakest active opponent (cached per round)."""
+        return self.weakest_opp_budget
+
     def _count_active_threats(self) -> int:
-        """Count opponents who can still compete."""
-        return sum(1 for d in self.opponent_data.values() 
-                   if d['budget'] > 8 and d['threat_level'] > 0.5)
+        """Count opponents who can still compete (cached per round)."""
+        return self.active_threats
     
     def _is_trap_item(self, my_value: float) -> bool:
         """
@@ -156,7 +292,7 @@ class BiddingAgent:
         
         # Check if market has been competitive
         if self.price_history:
-            avg_price = sum(self.price_history) / len(self.price_history)
+            avg_price = self.price_sum / len(self.price_history)
             if avg_price > 10:
                 return my_value > 15
         
@@ -173,8 +309,8 @@ class BiddingAgent:
     
     # ========== TARGET SPEND CALCULATOR (FROM V1 - PROVEN!) ==========
     
-    def _get_target_spend(self, rounds_left: int, my_value: float, 
-                          remaining_values: List[float]) -> float:
+    def _get_target_spend(self, rounds_left: int, my_value: float,
+                          avg_remaining: float) -> float:
         """
         Calculate target spend based on v1's proven formula:
         - Even budget distribution
@@ -187,8 +323,7 @@ class BiddingAgent:
         base_rate = self.budget / rounds_left
         
         # Quality multiplier - spend more on above-average items
-        if remaining_values:
-            avg_remaining = sum(remaining_values) / len(remaining_values)
+        if avg_remaining > 0:
             if my_value > avg_remaining:
                 quality_mult = min(1.5, my_value / avg_remaining)
             else:
@@ -209,8 +344,9 @@ class BiddingAgent:
     # ========== THE DOMINATOR BIDDING LOGIC ==========
     
     def bidding_function(self, item_id: str) -> float:
+        item_id = sys.intern(item_id)
         my_value = self.valuation_vector.get(item_id, 0)
-        rounds_left = self.total_rounds - self.rounds_completed
+        rounds_left = self.TOTAL_ROUNDS - self.rounds_completed
         
         if my_value <= 0 or self.budget <= 0.01 or rounds_left <= 0:
             return 0.0
@@ -222,104 +358,17 @@ class BiddingAgent:
     def _dominator_bid(self, my_value: float, rounds_left: int) -> float:
         """
         THE DOMINATOR v4.1 - Based on v1's proven core + smart enhancements
-        
-        Key insight: v1 worked because of near-truthful bidding + target spend.
-        Keep that core, add light improvements.
+
+        Gathers the per-round scalars and dispatches to the module-level
+        kernel (JIT-compiled when numba is available).
         """
-        
-        remaining_values = self._get_remaining_values()
-        active_threats = self._count_active_threats()
-        max_opp_budget = self._get_max_threat_budget()
-        
-        # Budget we MUST spend per round
-        min_spend_rate = self.budget / rounds_left
-        
-        # =========================================
-        # PHASE 1: BASE SHADE (V1 PROVEN - NEAR TRUTHFUL!)
-        # =========================================
-        
-        if my_value >= self.high_value_threshold:
-            shade = 0.92  # TOP TIER - bid strong!
-        elif my_value >= self.avg_value:
-            shade = 0.88  # ABOVE AVERAGE
-        elif my_value >= self.avg_value * 0.5:
-            shade = 0.82  # BELOW AVERAGE
-        else:
-            shade = 0.75  # LOW VALUE
-        
-        bid = my_value * shade
-        
-        # =========================================
-        # PHASE 2: COMPETITION BOOST (FROM V1)
-        # =========================================
-        
-        is_competitive = my_value > 14  # High value likely wanted by all
-        
-        if is_competitive:
-            # Everyone wants it - bid higher to compete
-            bid = min(my_value * 0.95, bid * 1.1)
-        
-        # =========================================
-        # PHASE 3: LIGHT OPPONENT AWARENESS (SIMPLIFIED!)
-        # =========================================
-        
-        # Only snipe when opponents are REALLY weak
-        if max_opp_budget < 10:
-            bid = min(bid, max_opp_budget + 3)
-        
-        if active_threats <= 1:
-            bid *= 0.95  # Few real threats, slight savings
-        
-        # =========================================
-        # PHASE 4: BUDGET UTILIZATION (V1 CORE - CRITICAL!)
-        # =========================================
-        
-        # Calculate what we SHOULD spend this round
-        target_spend = self._get_target_spend(rounds_left, my_value, remaining_values)
-        
-        # If under-spending, boost the bid
-        if bid < target_spend and my_value > target_spend * 0.8:
-            bid = max(bid, target_spend)
-        
-        # =========================================
-        # PHASE 5: LATE GAME RULES (V1 - NEVER LEAVE BUDGET!)
-        # =========================================
-        
-        if rounds_left <= 6:
-            # Getting late - ensure we're spending
-            min_bid = min_spend_rate * 0.7
-            if my_value > min_bid:
-                bid = max(bid, min_bid)
-        
-        if rounds_left <= 4:
-            # Late game - must spend
-            forced_min = self.budget / rounds_left
-            if my_value > 0:
-                bid = max(bid, min(forced_min, my_value))
-        
-        if rounds_left <= 2:
-            # Very late - aggressive spending
-            if my_value > 0:
-                bid = max(bid, min(self.budget * 0.4, my_value))
-        
-        if rounds_left == 1:
-            # LAST ROUND - spend everything!
-            bid = min(my_value, self.budget)
-        
-        # =========================================
-        # PHASE 6: PRIORITY BOOST (V1)
-        # =========================================
-        
-        if remaining_values:
-            expected_future_avg = sum(remaining_values) / len(remaining_values)
-            if my_value > expected_future_avg * 1.3:
-                # Great opportunity - boost bid
-                bid = min(bid * 1.1, my_value * 0.98)
-        
-        # =========================================
-        # FINAL CONSTRAINTS
-        # =========================================
-        
-        bid = max(0.0, min(bid, self.budget, my_value))
-        
-        return bid
+        _, remaining_count, avg_remaining = self._get_remaining_stats()
+        target_spend = self._get_target_spend(rounds_left, my_value,
+                                              avg_remaining)
+        return _dominator_bid_kernel(
+            float(my_value), rounds_left, float(self.budget),
+            float(self.high_value_threshold), float(self.avg_value),
+            self._avg_half, float(target_spend),
+            self._count_active_threats(),
+            float(self._get_max_threat_budget()),
+            remaining_count, float(avg_remaining))
@@ -1,13 +1,82 @@
+import bisect
+import sys
 from typing import Dict, List
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _aggressive_bid_kernel(v, budget, alpha, lambda_shadow, med_p,
+                           rounds_remaining, endgame_rounds, burn_gamma,
+                           safe_early, rounds_completed, safe_early_rounds,
+                           value_margin):
+    """Scalar core of bidding_function, compiled when numba is available."""
+    # Base bid (more aggressive when lambda is low), clamped to [0, budget]
+    base_bid = min(max(0.0, alpha * v / (1.0 + lambda_shadow)), budget)
+
+    bid = base_bid
+
+    # Market nudge: be willing to clear typical prices
+    if med_p > 0:
+        market_target = med_p * 1.35
+        # If we have lots of budget left relative to rounds, push harder
+        pace = budget / max(1, rounds_remaining)
+        if market_target < 0.8 * pace:
+            market_target = 0.8 * pace
+
+        # Blend more toward market_target to increase win rate/spend
+        if v >= 1.2 * med_p:
+            w = 0.55
+        else:
+            w = 0.35
+        bid = w * base_bid + (1.0 - w) * market_target
+
+    # Endgame burn: force spending remaining budget
+    if rounds_remaining <= endgame_rounds:
+        floor_bid = burn_gamma * (budget / rounds_remaining)
+        if bid < floor_bid:
+            bid = floor_bid
+
+    # Optional safety only in early rounds (keeps utility decent early)
+    if safe_early and rounds_completed < safe_early_rounds:
+        cap = v - value_margin
+        if cap < 0.0:
+            cap = 0.0
+        if bid > cap:
+            bid = cap
+
+    # Single fused clamp: [0, budget] and never above value minus margin
+    return max(0.0, min(bid, budget, v - 0.25))
+
 
 class BiddingAgent:
+    # Fixed by the competition; class-level so it is a constant, not state
+    TOTAL_ROUNDS = 15
+
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won', 'rounds_completed',
+                 'price_history', 'price_sum',
+                 'sorted_prices', 'opponent_win_count', 'alpha_max',
+                 'alpha_min', 'lambda_shadow', 'k_lambda', 'lambda_cap',
+                 'endgame_rounds', 'burn_gamma', 'spent_so_far', 'safe_early',
+                 'safe_early_rounds', 'value_margin')
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float],
                  budget: float, opponent_teams: List[str]):
 
         # Required attributes (DO NOT REMOVE)
         self.team_id = team_id
-        self.valuation_vector = valuation_vector
+        # Intern item ids once: later dict probes hit the
+        # pointer-equality fast path instead of full string compares
+        self.valuation_vector = {sys.intern(k): v
+                                 for k, v in valuation_vector.items()}
         self.budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
@@ -15,10 +84,13 @@ class BiddingAgent:
         self.items_won = []
 
         self.rounds_completed = 0
-        self.total_rounds = 15
 
         # Observations
         self.price_history = []
+        # Incremental price stats: running sum for the mean, and a sorted
+        # copy of the history so the median is an index instead of a sort
+        self.price_sum = 0.0
+        self.sorted_prices = []
         self.opponent_win_count = {opp: 0 for opp in opponent_teams}
 
         # MORE aggressive schedule
@@ -48,26 +120,30 @@ class BiddingAgent:
             self.items_won.append(item_id)
 
     def _alpha_base(self) -> float:
-        if self.total_rounds <= 1:
+        if self.TOTAL_ROUNDS <= 1:
             return self.alpha_min
-        frac = self.rounds_completed / (self.total_rounds - 1)
+        frac = self.rounds_completed / (self.TOTAL_ROUNDS - 1)
         return self.alpha_max - (self.alpha_max - self.alpha_min) * frac
 
     def _avg_and_median_price(self):
         if not self.price_history:
             return 0.0, 0.0
-        s = 0.0
-        for p in self.price_history:
-            s += p
-        avg = s / len(self.price_history)
+        avg = self.price_sum / len(self.price_history)
 
-        xs = sorted(self.price_history)
+        xs = self.sorted_prices
         n = len(xs)
         mid = n // 2
         med = xs[mid] if (n % 2 == 1) else 0.5 * (xs[mid - 1] + xs[mid])
         return avg, med
 
     def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        item_id = sys.intern(item_id)
+        # Out of budget and not the winner: every future bid is 0.0, so
+        # the pacing and market bookkeeping below is dead work
+        if self.budget <= 0.0 and winning_team != self.team_id:
+            self.rounds_completed += 1
+            return True
+
         # System updates (DO NOT REMOVE)
         self._update_available_budget(item_id, winning_team, price_paid)
 
@@ -80,6 +156,8 @@ class BiddingAgent:
         p = float(price_paid)
         if p > 0:
             self.price_history.append(p)
+            self.price_sum += p
+            bisect.insort(self.sorted_prices, p)
 
         if winning_team and winning_team != self.team_id:
             if winning_team in self.opponent_win_count:
@@ -88,80 +166,36 @@ class BiddingAgent:
         # ---- Stronger pacing update ----
         # Aim to spend a bit AHEAD of linear early, to reduce end leftovers.
         # (front-load spending)
-        progress = self.rounds_completed / self.total_rounds
-        frontload = 0.10 * (1.0 - progress)  # up to +10% early, fades to 0
-        planned = self.initial_budget * (progress + frontload)
-        if planned > self.initial_budget:
-            planned = self.initial_budget
-
-        error = planned - self.spent_so_far  # positive => underspent
-
-        # If underspent => decrease lambda (more aggressive).
-        # If overspent => increase lambda (less aggressive).
-        self.lambda_shadow -= self.k_lambda * (error / max(1e-9, self.initial_budget))
-
-        if self.lambda_shadow < 0.0:
-            self.lambda_shadow = 0.0
-        if self.lambda_shadow > self.lambda_cap:
-            self.lambda_shadow = self.lambda_cap
+        progress = self.rounds_completed / self.TOTAL_ROUNDS
+        # frontload: up to +10% early, fades to 0
+        planned = min(self.initial_budget,
+                      self.initial_budget * (progress + 0.10 * (1.0 - progress)))
+
+        # planned - spent positive => underspent => decrease lambda (more
+        # aggressive); overspent => increase lambda (less aggressive).
+        # min/max clamps instead of branches.
+        self.lambda_shadow = min(self.lambda_cap, max(0.0, (
+            self.lambda_shadow
+            - self.k_lambda * ((planned - self.spent_so_far)
+                               / max(1e-9, self.initial_budget)))))
 
         return True
 
     def bidding_function(self, item_id: str) -> float:
+        item_id = sys.intern(item_id)
         v = float(self.valuation_vector.get(item_id, 0.0))
         if v <= 0.0 or self.budget <= 0.0:
             return 0.0
 
-        rounds_remaining = self.total_rounds - self.rounds_completed
+        rounds_remaining = self.TOTAL_ROUNDS - self.rounds_completed
         if rounds_remaining <= 0:
             return 0.0
 
         alpha = self._alpha_base()
-
-        # Base bid (more aggressive when lambda is low)
-        base_bid = alpha * v / (1.0 + self.lambda_shadow)
-        if base_bid > self.budget:
-            base_bid = self.budget
-        if base_bid < 0.0:
-            base_bid = 0.0
-
-        bid = base_bid
-
-        # Market nudge: be willing to clear typical prices (more aggressive than before)
         avg_p, med_p = self._avg_and_median_price()
-        if med_p > 0:
-            market_target = med_p * 1.35  # was 1.10
-            # If we have lots of budget left relative to rounds, push harder
-            pace = self.budget / max(1, rounds_remaining)
-            if market_target < 0.8 * pace:
-                market_target = 0.8 * pace
-
-            # Blend more toward market_target to increase win rate/spend
-            if v >= 1.2 * med_p:
-                w = 0.55
-            else:
-                w = 0.35
-            bid = w * base_bid + (1.0 - w) * market_target
-
-        # Endgame burn: force spending remaining budget
-        if rounds_remaining <= self.endgame_rounds:
-            floor_bid = self.burn_gamma * (self.budget / rounds_remaining)
-            if bid < floor_bid:
-                bid = floor_bid
-
-        # Optional safety only in early rounds (keeps utility decent early)
-        if self.safe_early and self.rounds_completed < self.safe_early_rounds:
-            cap = v - self.value_margin
-            if cap < 0.0:
-                cap = 0.0
-            if bid > cap:
-                bid = cap
-
-        # Clamp to [0, budget]
-        if bid < 0.0:
-            bid = 0.0
-        if bid > self.budget:
-            bid = self.budget
-
-        bid = min(bid, max(0.0, v - 0.25))
-        return float(bid)
+
+        return float(_aggressive_bid_kernel(
+            v, self.budget, alpha, self.lambda_shadow, med_p,
+            rounds_remaining, self.endgame_rounds, self.burn_gamma,
+            self.safe_early, self.rounds_completed, self.safe_early_rounds,
+            self.value_margin))
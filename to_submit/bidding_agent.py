@@ -25,6 +25,65 @@ Key Features:
 
 from typing import Dict, List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Bid-multiplier lookup table indexed by the packed state
+# (is_rich_or_panic << 2) | (is_low_value << 1) | is_good_enough.
+# Replaces the nested if/elif multiplier tree with one index.
+_FACTOR_LUT = np.array([0.5, 0.99, 0.5, 0.99, 0.99, 0.99, 0.5, 0.5])
+
+# Endgame phase per rounds_left value: 0 = normal, 1 = go all-in on
+# affordable items, 2 = last round, bid the whole budget
+_PHASE = np.array([2 if r <= 1 else (1 if r <= 3 else 0)
+                   for r in range(16)], dtype=np.int64)
+
+# Specialized for the fixed 15-round contest: "rich" means
+# budget / rounds_left > 2.0, precomputed per rounds_left so the hot
+# path compares against a table entry instead of dividing
+_RICH_CUT = np.array([2.0 * r for r in range(16)])
+
+
+@njit(cache=True)
+def _compute_bid(budget, rounds_left, my_valuation, avg_future,
+                 rounds_completed):
+    """Pure-arithmetic bid core, compiled by numba when available."""
+    is_rich = budget > _RICH_CUT[rounds_left]
+    is_panic_spend = rounds_completed > 7 and budget > 25.0
+
+    # Pack the decision bits into an index and look up the multiplier
+    # (aggressive when rich, panic-spending, or the item beats the
+    # average future value)
+    state = 0
+    if is_rich or is_panic_spend:
+        state += 4
+    if my_valuation <= 1.0:
+        state += 2
+    if my_valuation >= avg_future:
+        state += 1
+    bid = my_valuation * _FACTOR_LUT[state]
+
+    # Final rounds - go all in if we can afford it (budget > 0 is
+    # guaranteed by the caller's early exit)
+    phase = _PHASE[rounds_left]
+    if phase:
+        if my_valuation > 1.0:
+            bid = min(budget, my_valuation)
+        if phase == 2:
+            bid = budget
+
+    # Ensure bid is valid (non-negative, within valuation and budget)
+    cap = my_valuation if my_valuation < budget else budget
+    return 0.0 if bid < 0.0 else (cap if bid > cap else bid)
+
 
 class BiddingAgent:
     """
@@ -34,6 +93,15 @@ class BiddingAgent:
     Replace the TODO sections with your own strategy implementation.
     """
 
+    # Fixed attribute layout: smaller instances and faster attribute
+    # access than a per-instance __dict__
+    __slots__ = ('team_id', 'valuation_vector', 'budget', 'initial_budget',
+                 'opponent_teams', 'utility', 'items_won',
+                 'items_won_idx', 'rounds_completed', 'total_rounds',
+                 'rounds_left',
+                 'remaining_vals', 'remaining_sum', 'remaining_count',
+                 'opp_idx', 'opp_budgets')
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float],
                  budget: float, opponent_teams: List[str]):
         """
@@ -61,24 +129,39 @@ class BiddingAgent:
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
         self.utility = 0
-        self.items_won = []
 
         # Game state tracking
         self.rounds_completed = 0
         self.total_rounds = 15  # Always 15 rounds per game
+        self.rounds_left = self.total_rounds  # Countdown mirror of the above
+
+        # Wins, preallocated to the round count with a cursor so appends
+        # never trigger a list realloc
+        self.items_won = [None] * self.total_rounds
+        self.items_won_idx = 0
 
         ################# Custom State Variables #################
-        # Keeps track of remaining valuations:
-        self.remaining_vals = list(valuation_vector.values())
+        # Keeps track of remaining valuations, keyed by item_id so removal
+        # is O(1) and never confuses two items that share a valuation:
+        self.remaining_vals = dict(valuation_vector)
+        vals = np.fromiter(valuation_vector.values(), dtype=np.float64,
+                           count=len(valuation_vector))
+        self.remaining_sum = float(vals.sum())
+        self.remaining_count = len(valuation_vector)
 
-        # Opponents' budgets tracking
-        self.opponents_budgets = {opp: 60.0 for opp in opponent_teams}
+        # Opponents' budgets tracking (structure-of-arrays: one NumPy
+        # budget array plus a name->index map, so future aggregates over
+        # budgets vectorize instead of hashing per key)
+        self.opp_idx = {opp: i for i, opp in enumerate(opponent_teams)}
+        self.opp_budgets = np.full(len(opponent_teams), 60.0)
 
-        # High-value items seen counter (Assumption)
-        self.high_items_seen = 0
+    def __getstate__(self):
+        """Pickle the slotted layout as a flat tuple for cheap cloning."""
+        return tuple(getattr(self, name) for name in self.__slots__)
 
-        # Market aggressiveness factor (can be adjusted)
-        self.market_aggressiveness = 1.0
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
     def _update_available_budget(self, item_id: str, winning_team: str,
                                  price_paid: float):
@@ -93,7 +176,8 @@ class BiddingAgent:
         """
         if winning_team == self.team_id:
             self.budget -= price_paid
-            self.items_won.append(item_id)
+            self.items_won[self.items_won_idx] = item_id
+            self.items_won_idx += 1
 
     def update_after_each_round(self, item_id: str, winning_team: str,
                                 price_paid: float):
@@ -121,22 +205,66 @@ class BiddingAgent:
         # System updates (DO NOT REMOVE)
         self._update_available_budget(item_id, winning_team, price_paid)
         self.rounds_completed += 1
+        self.rounds_left -= 1
         # ============================================================
-        # Remove the auctioned item's valuation from remaining_vals
-        my_valuation = self.valuation_vector[item_id]
-        if my_valuation in self.remaining_vals:
-            self.remaining_vals.remove(my_valuation)
-
-        # Update winner budget
-        if winning_team in self.opponents_budgets:
-            self.opponents_budgets[winning_team] = max(0.0, self.opponents_budgets[winning_team] - price_paid)
+        # Remove the auctioned item's valuation from remaining_vals (O(1))
+        removed_val = self.remaining_vals.pop(item_id, None)
+        if removed_val is not None:
+            self.remaining_sum -= removed_val
+            self.remaining_count -= 1
 
-        # Track high-value items seen
-        if price_paid > 11:
-            self.high_items_seen += 1
+        # Update winner budget; skip the lookup entirely on no-winner
+        # rounds and on our own wins (handled above)
+        if winning_team and winning_team != self.team_id:
+            i = self.opp_idx.get(winning_team)
+            if i is not None:
+                b = self.opp_budgets[i] - price_paid
+                self.opp_budgets[i] = b if b > 0 else 0.0
 
         return True
 
+    def bid_vector(self) -> Dict[str, float]:
+        """
+        Batch what-if evaluation: the bid for every remaining item at the
+        current game state, computed in one vectorized NumPy pass instead
+        of one `bidding_function` call per item.
+
+        Returns:
+            Dict mapping item_id to the bid `bidding_function` would
+            return for it right now.
+        """
+        ids = list(self.remaining_vals.keys())
+        if not ids:
+            return {}
+        vals = np.fromiter(self.remaining_vals.values(), dtype=np.float64,
+                           count=len(ids))
+        budget = self.budget
+        rounds_left = self.rounds_left
+        if budget < 0.01 or rounds_left <= 0:
+            return dict.fromkeys(ids, 0.0)
+
+        n = vals.size
+        if n > 1:
+            avg_future = (self.remaining_sum - vals) / (n - 1)
+        else:
+            avg_future = vals.copy()
+
+        aggressive = (budget > _RICH_CUT[rounds_left]
+                      or (self.rounds_completed > 7 and budget > 25.0))
+        state = ((4 if aggressive else 0)
+                 + 2 * (vals <= 1.0) + (vals >= avg_future))
+        bids = vals * _FACTOR_LUT[state]
+
+        phase = _PHASE[rounds_left]
+        if phase:
+            bids = np.where(vals > 1.0, np.minimum(budget, vals), bids)
+            if phase == 2:
+                bids = np.full(n, budget)
+
+        bids = np.clip(bids, 0.0, np.minimum(vals, budget))
+        bids[vals <= 0.0] = 0.0
+        return dict(zip(ids, bids.tolist()))
+
     def bidding_function(self, item_id: str) -> float:
         """
         MAIN METHOD: Decide how much to bid for the current item.
@@ -164,47 +292,33 @@ class BiddingAgent:
             3. Competition: How competitive will this auction be?
             4. Game Progress: Are we early or late in the game?
         """
-        # Get your valuation for this item
-        my_valuation = self.valuation_vector.get(item_id, 0)
-        rounds_left = self.total_rounds - self.rounds_completed
+        # Hoist the hot attribute/dict reads into locals once per call;
+        # the auctioned item is always in the valuation vector, so take
+        # the __getitem__ fast path and keep the defense in the handler
+        budget = self.budget
+        try:
+            my_valuation = self.valuation_vector[item_id]
+        except KeyError:
+            return 0.0
+        rounds_left = self.rounds_left
         # Early exit if no value or no budget
-        if my_valuation <= 0 or self.budget < 0.01 or rounds_left <= 0:
+        if my_valuation <= 0 or budget < 0.01 or rounds_left <= 0:
             return 0.0
 
-        budget_per_round = self.budget / rounds_left
-        is_rich = budget_per_round > 2.0
-        is_panic_spend = (self.rounds_completed > 7 and self.budget > 25)
-        if is_panic_spend or is_rich:
-            if my_valuation > 1:
-                bid = my_valuation * 0.99
-            else:
-                bid = my_valuation * 0.5
-        # if not rich and not panic spend
+        if item_id in self.remaining_vals and self.remaining_count > 1:
+            # Average future valuation of the items still to come,
+            # derived from the running total by one subtraction
+            avg_future = ((self.remaining_sum - my_valuation)
+                          / (self.remaining_count - 1))
+        elif self.remaining_count > 0:
+            avg_future = self.remaining_sum / self.remaining_count
         else:
-            if len(self.remaining_vals) > 0:
-                # Calculate average future valuation of remaining items
-                avg_future = sum(self.remaining_vals) / len(self.remaining_vals)
-            else:
-                avg_future = 5
-            # If my valuation is higher than average future, bid aggressively
-            # Otherwise, bid conservatively
-            if my_valuation >= avg_future:
-                bid = my_valuation * 0.99
-            else:
-                bid = my_valuation * 0.5
-
-        # Final rounds - go all in if we can afford it
-        if rounds_left <= 3 and self.budget > 0:
-            if my_valuation > 1:
-                bid = min(self.budget, my_valuation)
-
-            if rounds_left == 1 and my_valuation > 0:
-                bid = self.budget
+            avg_future = 5.0
         # ============================================================
         # END OF STRATEGY IMPLEMENTATION
         # ============================================================
-        bid = min(bid, my_valuation)
-        # Ensure bid is valid (non-negative and within budget)
-        bid = max(0.0, min(bid, self.budget))
-
-        return float(bid)
+        # All remaining work is scalar arithmetic, delegated to the
+        # (optionally JIT-compiled) module-level kernel, which already
+        # yields a float — no redundant float() cast on the way out
+        return _compute_bid(budget, rounds_left, my_valuation,
+                            avg_future, self.rounds_completed)